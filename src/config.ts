@@ -9,15 +9,16 @@ const __dirname = dirname(__filename);
 dotenv.config({ path: resolve(__dirname, '..', '.env') });
 
 export interface SpecContextConfig {
-    name: string;
-    version: string;
-    dashboardUrl: string;
+    readonly name: string;
+    readonly version: string;
+    readonly dashboardUrl: string;
 }
 
 export function createConfig(): SpecContextConfig {
-    return {
+    // Built once at startup and only read afterwards.
+    return Object.freeze({
         name: 'spec-context-mcp',
         version: getPackageVersion(),
         dashboardUrl: process.env.DASHBOARD_URL || DEFAULT_DASHBOARD_URL,
-    };
+    });
 }
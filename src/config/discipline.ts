@@ -92,16 +92,17 @@ export const PROVIDER_CAPABILITIES: Record<CanonicalProvider, { schemaConstraine
   opencode: { schemaConstrained: true },
 };
 
+// Canonical names and aliases in one table, so already-normalized values resolve
+// with a single lookup before any trimming or lowercasing.
+const PROVIDER_LOOKUP: ReadonlyMap<string, CanonicalProvider> = new Map<string, CanonicalProvider>([
+  ...(Object.keys(PROVIDER_CATALOG) as CanonicalProvider[]).map(
+    provider => [provider, provider] as [string, CanonicalProvider]
+  ),
+  ...Object.entries(PROVIDER_ALIASES),
+]);
+
 function resolveCanonicalProvider(value: string): CanonicalProvider | null {
-  const key = value.trim().toLowerCase();
-  if (key in PROVIDER_CATALOG) {
-    return key as CanonicalProvider;
-  }
-  const alias = PROVIDER_ALIASES[key as keyof typeof PROVIDER_ALIASES];
-  if (!alias) {
-    return null;
-  }
-  return alias as CanonicalProvider;
+  return PROVIDER_LOOKUP.get(value) ?? PROVIDER_LOOKUP.get(value.trim().toLowerCase()) ?? null;
 }
 
 function renderDispatchToken(value: string): string {
@@ -116,6 +117,10 @@ function renderDispatchTemplate(template: DispatchCommandTemplate): string {
 }
 
 export function resolveDispatchProvider(value: string): CanonicalProvider | null {
+  const exact = PROVIDER_LOOKUP.get(value);
+  if (exact) {
+    return exact;
+  }
   const trimmed = value.trim().toLowerCase();
   if (!trimmed) {
     return null;
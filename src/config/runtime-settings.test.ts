@@ -35,6 +35,17 @@ describe('runtime settings resolution', () => {
     });
   });
 
+  it('shares one frozen defaults result while no runtime settings are stored', async () => {
+    const first = await resolveRuntimeSettings();
+    const second = await resolveRuntimeSettings();
+
+    expect(second).toBe(first);
+    expect(Object.isFrozen(first)).toBe(true);
+    for (const setting of Object.values(first)) {
+      expect(Object.isFrozen(setting)).toBe(true);
+    }
+  });
+
   it('ignores env vars — all settings come from json or default', async () => {
     process.env.SPEC_CONTEXT_DISCIPLINE = 'standard';
     process.env.SPEC_CONTEXT_IMPLEMENTER = 'codex';
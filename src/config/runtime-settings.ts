@@ -22,6 +22,7 @@ export interface ResolvedRuntimeSettings {
 }
 
 const DISCIPLINE_VALUES: readonly DisciplineMode[] = ['full', 'standard', 'minimal'];
+const DISCIPLINE_VALUE_SET: ReadonlySet<string> = new Set(DISCIPLINE_VALUES);
 const DEFAULT_DISCIPLINE: DisciplineMode = 'full';
 const DEFAULT_DASHBOARD_URL = 'http://localhost:3000';
 
@@ -38,7 +39,7 @@ function toDisciplineMode(value: unknown): DisciplineMode | null {
   }
 
   const normalized = value.trim().toLowerCase();
-  if (!DISCIPLINE_VALUES.includes(normalized as DisciplineMode)) {
+  if (!DISCIPLINE_VALUE_SET.has(normalized)) {
     return null;
   }
 
@@ -79,10 +80,7 @@ function resolveDashboardUrl(runtimeSettings: RuntimeSettings): ResolvedSetting<
   return { value: DEFAULT_DASHBOARD_URL, source: 'default' };
 }
 
-export async function resolveRuntimeSettings(): Promise<ResolvedRuntimeSettings> {
-  const settingsManager = new SettingsManager();
-  const runtimeSettings = await settingsManager.getRuntimeSettings();
-
+function buildResolvedRuntimeSettings(runtimeSettings: RuntimeSettings): ResolvedRuntimeSettings {
   return {
     discipline: resolveDiscipline(runtimeSettings),
     implementer: resolveNullableSetting(runtimeSettings.implementer),
@@ -94,3 +92,24 @@ export async function resolveRuntimeSettings(): Promise<ResolvedRuntimeSettings>
     dashboardUrl: resolveDashboardUrl(runtimeSettings),
   };
 }
+
+function freezeResolvedRuntimeSettings(settings: ResolvedRuntimeSettings): ResolvedRuntimeSettings {
+  for (const setting of Object.values(settings)) {
+    Object.freeze(setting);
+  }
+  return Object.freeze(settings);
+}
+
+// Most installs never save runtime settings, so the all-defaults result is built once and
+// shared; frozen down to each setting because every caller receives the same instance.
+const DEFAULT_RESOLVED_RUNTIME_SETTINGS = freezeResolvedRuntimeSettings(buildResolvedRuntimeSettings({}));
+
+export async function resolveRuntimeSettings(): Promise<ResolvedRuntimeSettings> {
+  const settingsManager = new SettingsManager();
+  const runtimeSettings = await settingsManager.getRuntimeSettings();
+  if (Object.keys(runtimeSettings).length === 0) {
+    return DEFAULT_RESOLVED_RUNTIME_SETTINGS;
+  }
+
+  return buildResolvedRuntimeSettings(runtimeSettings);
+}
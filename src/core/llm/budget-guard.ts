@@ -30,13 +30,12 @@ function hasRequiredTags(candidate: BudgetCandidate, policy: BudgetPolicy): bool
     return policy.allowedTags.every(tag => tags.has(tag));
 }
 
-function hasDeniedTags(candidate: BudgetCandidate, policy: BudgetPolicy): boolean {
-    if (!policy.deniedTags || policy.deniedTags.length === 0) {
+function hasDeniedTags(candidate: BudgetCandidate, deniedTags: ReadonlySet<string> | null): boolean {
+    if (!deniedTags || !candidate.tags) {
         return false;
     }
 
-    const tags = new Set(candidate.tags ?? []);
-    return policy.deniedTags.some(tag => tags.has(tag));
+    return candidate.tags.some(tag => deniedTags.has(tag));
 }
 
 export function filterBudgetCandidates(
@@ -47,6 +46,9 @@ export function filterBudgetCandidates(
 ): BudgetFilterResult {
     const reasonCodes = new Set<string>();
     const beforeCount = candidates.length;
+    const deniedTags = policy.deniedTags && policy.deniedTags.length > 0
+        ? new Set(policy.deniedTags)
+        : null;
 
     const filtered = candidates.filter(candidate => {
         if (!hasRequiredTags(candidate, policy)) {
@@ -54,7 +56,7 @@ export function filterBudgetCandidates(
             return false;
         }
 
-        if (hasDeniedTags(candidate, policy)) {
+        if (hasDeniedTags(candidate, deniedTags)) {
             reasonCodes.add('denied_tag');
             return false;
         }
@@ -39,6 +39,8 @@ export type { IRuntimeTelemetryMeter, RuntimeUsageSample, RuntimeTelemetrySnapsh
 export { InMemoryEventBusAdapter, type EventBusAdapter } from './event-bus-adapter.js';
 export { StateProjector } from './state-projector.js';
 export { PromptPrefixCompiler } from './prompt-prefix-compiler.js';
+export { TokenBucketRateLimiter } from './request-rate-limiter.js';
+export type { RequestRateLimiter, TokenBucketRateLimiterOptions } from './request-rate-limiter.js';
 export {
   ProviderCacheAdapterFactory,
   type ProviderCacheAdapter,
@@ -17,11 +17,14 @@ export interface InterceptionChainResult {
 const DEFAULT_PER_HOOK_BUDGET_MS = 5;
 const DEFAULT_TOTAL_CHAIN_BUDGET_MS = 20;
 
-function cloneRequest(request: ChatInterceptionRequest): ChatInterceptionRequest {
+function cloneRequest(
+    request: ChatInterceptionRequest,
+    messages: ChatInterceptionRequest['messages'] = request.messages
+): ChatInterceptionRequest {
     return {
         model: request.model,
         options: request.options,
-        messages: request.messages.map(message => ({ ...message })),
+        messages: messages.map(message => ({ ...message })),
     };
 }
 
@@ -132,12 +135,12 @@ export class InterceptionLayer {
                         `Interceptor "${interceptor.id}" attempted forbidden mutation at ${hook}`
                     );
                 }
+                // Copy the replacement messages directly when the interceptor supplies them,
+                // rather than copying the current messages only to overwrite the copy.
                 if (!copied) {
-                    current = cloneRequest(current);
+                    current = cloneRequest(current, decision.messages);
                     copied = true;
-                }
-
-                if (decision.messages) {
+                } else if (decision.messages) {
                     current.messages = decision.messages.map(message => ({ ...message }));
                 }
 
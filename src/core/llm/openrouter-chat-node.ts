@@ -11,6 +11,7 @@ import {
 } from './openrouter-chat.js';
 import { PromptPrefixCompiler } from './prompt-prefix-compiler.js';
 import { ProviderCacheAdapterFactory } from './provider-cache-adapter.js';
+import { TokenBucketRateLimiter } from './request-rate-limiter.js';
 import { createRuntimeTelemetryMeter } from './telemetry-meter.js';
 
 class OpenRouterSdkClient implements OpenRouterClient {
@@ -41,6 +42,9 @@ export function createNodeOpenRouterChatDependencies(config: OpenRouterChatConfi
     promptPrefixCompiler: new PromptPrefixCompiler(),
     cacheAdapter: config.cacheAdapter ?? ProviderCacheAdapterFactory.create(provider),
     telemetryMeter: config.telemetryMeter ?? createRuntimeTelemetryMeter(),
+    rateLimiter: config.maxRequestsPerSecond
+      ? new TokenBucketRateLimiter({ requestsPerSecond: config.maxRequestsPerSecond })
+      : undefined,
   };
 }
 
@@ -3,6 +3,7 @@ import { randomUUID } from 'crypto';
 import type { IBudgetGuard } from './budget-guard.js';
 import { BudgetExceededError, InterceptorDroppedError } from './errors.js';
 import type { LlmProvider, ProviderCacheAdapter } from './provider-cache-adapter.js';
+import type { RequestRateLimiter } from './request-rate-limiter.js';
 import type { IRuntimeTelemetryMeter } from './telemetry-meter.js';
 import type {
     ChatProvider,
@@ -21,6 +22,8 @@ export interface OpenRouterChatConfig {
     provider?: LlmProvider;
     cacheAdapter?: ProviderCacheAdapter;
     telemetryMeter?: IRuntimeTelemetryMeter;
+    /** Cap on outbound provider requests per second; unset means unlimited. */
+    maxRequestsPerSecond?: number;
 }
 
 type RuntimeRequest = {
@@ -29,6 +32,11 @@ type RuntimeRequest = {
     options: ChatOptions;
 };
 
+type RuntimeEventEmitter = (
+    type: 'LLM_REQUEST' | 'LLM_RESPONSE' | 'BUDGET_DECISION' | 'INTERCEPTOR_DECISION' | 'STATE_DELTA' | 'ERROR',
+    payload: Record<string, unknown>,
+) => Promise<void>;
+
 type InterceptionHook = 'on_ingress' | 'on_send_pre_cache_key' | 'on_send_post_route';
 
 interface InterceptionContext {
@@ -96,10 +104,14 @@ export interface OpenRouterChatDependencies {
     promptPrefixCompiler: RuntimePromptPrefixCompiler;
     cacheAdapter: ProviderCacheAdapter;
     telemetryMeter: IRuntimeTelemetryMeter;
+    rateLimiter?: RequestRateLimiter;
 }
 
 type ProviderChatMessage = OpenAI.Chat.Completions.ChatCompletionMessageParam;
 
+// Matched against the lower-cased provider error message.
+const UNSUPPORTED_OPTION_ERROR_PATTERN = /unsupported|unknown parameter|not allowed|invalid parameter/;
+
 type ChatMessageSerializer = (message: ChatMessage) => ProviderChatMessage;
 
 const CHAT_MESSAGE_SERIALIZERS: Record<ChatMessage['role'], ChatMessageSerializer> = {
@@ -144,6 +156,7 @@ export class OpenRouterChat implements ChatProvider {
     private cacheAdapter: ProviderCacheAdapter;
     private telemetryMeter: IRuntimeTelemetryMeter;
     private provider: LlmProvider;
+    private rateLimiter: RequestRateLimiter | null;
 
     constructor(config: OpenRouterChatConfig, dependencies: OpenRouterChatDependencies) {
         this.client = dependencies.client;
@@ -156,6 +169,7 @@ export class OpenRouterChat implements ChatProvider {
         this.provider = config.provider ?? 'openrouter';
         this.cacheAdapter = dependencies.cacheAdapter;
         this.telemetryMeter = dependencies.telemetryMeter;
+        this.rateLimiter = dependencies.rateLimiter ?? null;
     }
 
     async chat(messages: ChatMessage[], options?: ChatOptions): Promise<ChatResponse> {
@@ -176,10 +190,10 @@ export class OpenRouterChat implements ChatProvider {
         let budgetDecision = undefined;
         let eventCounter = 0;
 
-        const emitEvent = async (type: 'LLM_REQUEST' | 'LLM_RESPONSE' | 'BUDGET_DECISION' | 'INTERCEPTOR_DECISION' | 'STATE_DELTA' | 'ERROR', payload: Record<string, unknown>) => {
-            if (!options?.runtime?.emitEvent) {
-                return;
-            }
+        // Null when no runtime sink is attached, so `emitEvent?.(...)` call sites skip
+        // building payloads (and an awaited no-op) on every request.
+        const runtimeEmitEvent = options?.runtime?.emitEvent;
+        const emitEvent: RuntimeEventEmitter | null = runtimeEmitEvent ? async (type, payload) => {
             eventCounter += 1;
             const eventDraft: RuntimeEventDraft = {
                 idempotency_key: `${idempotencyKey}:${type.toLowerCase()}:${eventCounter}`,
@@ -191,8 +205,8 @@ export class OpenRouterChat implements ChatProvider {
                 type,
                 payload,
             };
-            await options.runtime.emitEvent(eventDraft);
-        };
+            await runtimeEmitEvent(eventDraft);
+        } : null;
 
         try {
             const interceptors = options?.runtime?.interceptors ?? [];
@@ -244,7 +258,7 @@ export class OpenRouterChat implements ChatProvider {
                     options.runtime.budget.preferredModel ?? request.model
                 );
                 budgetDecision = budgetResult.decision;
-                await emitEvent('BUDGET_DECISION', budgetDecision as unknown as Record<string, unknown>);
+                await emitEvent?.('BUDGET_DECISION', budgetDecision as unknown as Record<string, unknown>);
 
                 if (
                     budgetResult.decision.decision === 'deny' ||
@@ -265,7 +279,9 @@ export class OpenRouterChat implements ChatProvider {
 
             const promptCacheRetention: 'in_memory' | '24h' =
                 options?.providerOptions?.promptCaching?.retention === '24h' ? '24h' : 'in_memory';
-            const promptCacheKey = options?.providerOptions?.promptCaching?.key ?? prefixCompile.cacheKey;
+            // Key on the stable prefix only: requests that share it must land on the
+            // same provider cache, which a key including the dynamic tail never allows.
+            const promptCacheKey = options?.providerOptions?.promptCaching?.key ?? prefixCompile.stablePrefixHash;
             const cacheRequest = {
                 model: request.model,
                 promptCacheKey,
@@ -294,10 +310,10 @@ export class OpenRouterChat implements ChatProvider {
             }
 
             if (interceptionReports.length > 0) {
-                await emitEvent('INTERCEPTOR_DECISION', { reports: interceptionReports });
+                await emitEvent?.('INTERCEPTOR_DECISION', { reports: interceptionReports });
             }
 
-            await emitEvent('LLM_REQUEST', {
+            await emitEvent?.('LLM_REQUEST', {
                 model: request.model,
                 message_count: request.messages.length,
                 cache_key: promptCacheKey,
@@ -357,7 +373,7 @@ export class OpenRouterChat implements ChatProvider {
                 latencyMs: Date.now() - startedAt,
             });
 
-            await emitEvent('LLM_RESPONSE', {
+            await emitEvent?.('LLM_RESPONSE', {
                 model: response.model,
                 usage: {
                     promptTokens,
@@ -382,7 +398,7 @@ export class OpenRouterChat implements ChatProvider {
                 runtime: runtimeResponse,
             };
         } catch (error) {
-            await emitEvent('ERROR', {
+            await emitEvent?.('ERROR', {
                 message: error instanceof Error ? error.message : String(error),
                 code: (error as any)?.code ?? 'unknown',
             });
@@ -410,9 +426,10 @@ export class OpenRouterChat implements ChatProvider {
 
     private async executeWithProviderDowngrade(
         requestOptions: ProviderChatRequest,
-        emitEvent: (type: 'LLM_REQUEST' | 'LLM_RESPONSE' | 'BUDGET_DECISION' | 'INTERCEPTOR_DECISION' | 'STATE_DELTA' | 'ERROR', payload: Record<string, unknown>) => Promise<void>
+        emitEvent: RuntimeEventEmitter | null
     ) {
         try {
+            await this.rateLimiter?.acquire();
             return await this.client.createChatCompletion(requestOptions, { timeout: this.timeout });
         } catch (error) {
             const downgraded = this.stripUnsupportedProviderOptions(requestOptions, error);
@@ -420,12 +437,13 @@ export class OpenRouterChat implements ChatProvider {
                 throw error;
             }
 
-            await emitEvent('STATE_DELTA', {
+            await emitEvent?.('STATE_DELTA', {
                 capability_downgrade: true,
                 removed_fields: downgraded.removedFields,
                 reason: downgraded.reason,
             });
 
+            await this.rateLimiter?.acquire();
             return this.client.createChatCompletion(downgraded.requestOptions, { timeout: this.timeout });
         }
     }
@@ -440,8 +458,7 @@ export class OpenRouterChat implements ChatProvider {
         requestOptions: ProviderChatRequest;
     } {
         const message = error instanceof Error ? error.message.toLowerCase() : String(error).toLowerCase();
-        const unsupportedPatterns = ['unsupported', 'unknown parameter', 'not allowed', 'invalid parameter'];
-        const hasCapabilityFailure = unsupportedPatterns.some(pattern => message.includes(pattern));
+        const hasCapabilityFailure = UNSUPPORTED_OPTION_ERROR_PATTERN.test(message);
 
         if (!hasCapabilityFailure) {
             return {
@@ -1,4 +1,5 @@
 import { createHash } from 'crypto';
+import { setBoundedMapEntry } from '../cache/bounded-map.js';
 import type { ChatMessage } from './types.js';
 
 export interface PromptPrefixCompileInput {
@@ -25,7 +26,13 @@ function normalizeMessages(messages: ChatMessage[]): Array<{ role: string; conte
     }));
 }
 
+const MAX_STABLE_PREFIX_HASH_ENTRIES = 64;
+
 export class PromptPrefixCompiler {
+    // The stable prefix (system prompt, model, mode) repeats across calls while only the
+    // tail changes, so remember its digest instead of re-hashing the same text each time.
+    private readonly stablePrefixHashes = new Map<string, string>();
+
     compile(input: PromptPrefixCompileInput): PromptPrefixCompileResult {
         const normalizedMessages = normalizeMessages(input.messages);
         const dynamicTailMessages = Math.max(1, input.dynamicTailMessages ?? 1);
@@ -41,7 +48,7 @@ export class PromptPrefixCompiler {
             messages: normalizedMessages.slice(splitIndex),
         });
 
-        const stablePrefixHash = sha256(stablePrefix);
+        const stablePrefixHash = this.hashStablePrefix(stablePrefix);
         const dynamicTailHash = sha256(dynamicTail);
         const cacheKey = sha256(`${stablePrefixHash}:${dynamicTailHash}`);
 
@@ -51,4 +58,14 @@ export class PromptPrefixCompiler {
             cacheKey,
         };
     }
+
+    private hashStablePrefix(stablePrefix: string): string {
+        const cached = this.stablePrefixHashes.get(stablePrefix);
+        if (cached) {
+            return cached;
+        }
+        const digest = sha256(stablePrefix);
+        setBoundedMapEntry(this.stablePrefixHashes, stablePrefix, digest, MAX_STABLE_PREFIX_HASH_ENTRIES);
+        return digest;
+    }
 }
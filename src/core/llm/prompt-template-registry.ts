@@ -32,11 +32,38 @@ function segmentWeight(kind: PromptSegmentKind): number {
     return idx >= 0 ? idx : SEGMENT_ORDER.length;
 }
 
+/** Tail-independent part of a compiled template, shared by every compile call. */
+interface CompiledTemplateBase {
+    segmentText: string;
+    hasSegments: boolean;
+    stablePrefix: string;
+    stablePrefixHash: string;
+}
+
+function compileTemplateBase(template: PromptTemplate): CompiledTemplateBase {
+    const sorted = [...template.segments].sort((a, b) => segmentWeight(a.kind) - segmentWeight(b.kind));
+    const stablePrefix = sorted
+        .filter(segment => segment.stable)
+        .map(segment => segment.content)
+        .join('\n\n')
+        .trim();
+
+    return {
+        segmentText: sorted.map(segment => segment.content).join('\n\n'),
+        hasSegments: sorted.length > 0,
+        stablePrefix,
+        stablePrefixHash: hash(stablePrefix),
+    };
+}
+
 export class PromptTemplateRegistry {
     private readonly templates = new Map<string, PromptTemplate>();
+    private readonly compiledBases = new Map<string, CompiledTemplateBase>();
 
     register(template: PromptTemplate): void {
-        this.templates.set(this.key(template.templateId, template.version), template);
+        const key = this.key(template.templateId, template.version);
+        this.templates.set(key, template);
+        this.compiledBases.set(key, compileTemplateBase(template));
     }
 
     get(templateId: string, version: string): PromptTemplate | null {
@@ -44,29 +71,21 @@ export class PromptTemplateRegistry {
     }
 
     compile(templateId: string, version: string, dynamicTail?: string): CompiledPrompt {
-        const template = this.get(templateId, version);
-        if (!template) {
+        const base = this.compiledBases.get(this.key(templateId, version));
+        if (!base) {
             throw new Error(`Prompt template not found: ${templateId}@${version}`);
         }
 
-        const sorted = [...template.segments].sort((a, b) => segmentWeight(a.kind) - segmentWeight(b.kind));
-        const segments = sorted.map(segment => ({ ...segment }));
-
+        let text = base.segmentText;
         if (dynamicTail && dynamicTail.trim().length > 0) {
-            segments.push({ kind: 'dynamic', stable: false, content: dynamicTail });
+            text = base.hasSegments ? `${text}\n\n${dynamicTail}` : dynamicTail;
         }
-
-        const text = segments.map(segment => segment.content).join('\n\n').trim();
-        const stablePrefix = segments
-            .filter(segment => segment.stable)
-            .map(segment => segment.content)
-            .join('\n\n')
-            .trim();
+        text = text.trim();
 
         return {
             text,
-            stablePrefix,
-            stablePrefixHash: hash(stablePrefix),
+            stablePrefix: base.stablePrefix,
+            stablePrefixHash: base.stablePrefixHash,
             fullPromptHash: hash(text),
         };
     }
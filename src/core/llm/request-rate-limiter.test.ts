@@ -0,0 +1,48 @@
+import { describe, expect, it } from 'vitest';
+import { TokenBucketRateLimiter } from './request-rate-limiter.js';
+
+function createClock() {
+    let now = 0;
+    const sleeps: number[] = [];
+    return {
+        sleeps,
+        advance(ms: number) {
+            now += ms;
+        },
+        options: {
+            now: () => now,
+            sleep: async (ms: number) => {
+                sleeps.push(ms);
+            },
+        },
+    };
+}
+
+describe('TokenBucketRateLimiter', () => {
+    it('admits a burst immediately and spaces out the callers behind it', async () => {
+        const clock = createClock();
+        const limiter = new TokenBucketRateLimiter({ requestsPerSecond: 2, ...clock.options });
+
+        await Promise.all([limiter.acquire(), limiter.acquire(), limiter.acquire(), limiter.acquire()]);
+
+        expect(clock.sleeps).toEqual([500, 1000]);
+    });
+
+    it('refills tokens as time passes without exceeding the burst', async () => {
+        const clock = createClock();
+        const limiter = new TokenBucketRateLimiter({ requestsPerSecond: 1, burst: 2, ...clock.options });
+
+        await limiter.acquire();
+        await limiter.acquire();
+        clock.advance(10_000);
+        await limiter.acquire();
+        await limiter.acquire();
+        await limiter.acquire();
+
+        expect(clock.sleeps).toEqual([1000]);
+    });
+
+    it('rejects non-positive rates', () => {
+        expect(() => new TokenBucketRateLimiter({ requestsPerSecond: 0 })).toThrow();
+    });
+});
@@ -0,0 +1,53 @@
+export interface RequestRateLimiter {
+    acquire(): Promise<void>;
+}
+
+export interface TokenBucketRateLimiterOptions {
+    requestsPerSecond: number;
+    burst?: number;
+    now?: () => number;
+    sleep?: (ms: number) => Promise<void>;
+}
+
+function defaultSleep(ms: number): Promise<void> {
+    return new Promise(resolve => setTimeout(resolve, ms));
+}
+
+/**
+ * Token-bucket limiter for outbound provider requests.
+ * Bounds request rate (not concurrency): callers beyond the burst are spaced out
+ * in arrival order instead of hitting the provider together and retrying together.
+ */
+export class TokenBucketRateLimiter implements RequestRateLimiter {
+    private readonly requestsPerSecond: number;
+    private readonly burst: number;
+    private readonly now: () => number;
+    private readonly sleep: (ms: number) => Promise<void>;
+    private tokens: number;
+    private lastRefillAt: number;
+
+    constructor(options: TokenBucketRateLimiterOptions) {
+        if (!Number.isFinite(options.requestsPerSecond) || options.requestsPerSecond <= 0) {
+            throw new Error('requestsPerSecond must be a positive number');
+        }
+        this.requestsPerSecond = options.requestsPerSecond;
+        this.burst = Math.max(1, options.burst ?? Math.ceil(options.requestsPerSecond));
+        this.now = options.now ?? Date.now;
+        this.sleep = options.sleep ?? defaultSleep;
+        this.tokens = this.burst;
+        this.lastRefillAt = this.now();
+    }
+
+    acquire(): Promise<void> {
+        const now = this.now();
+        this.tokens = Math.min(this.burst, this.tokens + ((now - this.lastRefillAt) / 1000) * this.requestsPerSecond);
+        this.lastRefillAt = now;
+
+        // Reserve the token up front; a negative balance queues later callers behind this one.
+        this.tokens -= 1;
+        if (this.tokens >= 0) {
+            return Promise.resolve();
+        }
+        return this.sleep((-this.tokens / this.requestsPerSecond) * 1000);
+    }
+}
@@ -66,12 +66,9 @@ export class RuntimeSnapshotStore {
         const revision = previous ? previous.revision + 1 : 1;
         const now = new Date().toISOString();
 
-        const appliedOffsetsByPartition = new Map<string, AppliedOffset>();
-        if (previous) {
-            for (const offset of previous.applied_offsets) {
-                appliedOffsetsByPartition.set(offset.partition_key, offset);
-            }
-        }
+        const appliedOffsetsByPartition = new Map<string, AppliedOffset>(
+            (previous?.applied_offsets ?? []).map(offset => [offset.partition_key, offset])
+        );
 
         const current = appliedOffsetsByPartition.get(update.appliedOffset.partition_key);
         if (!current || current.sequence < update.appliedOffset.sequence) {
@@ -52,4 +52,13 @@ ${'Refactor token handling and integrate new interface boundaries. '.repeat(20)}
     const input = { taskDescription: 'Fix typo in README.md' };
     expect(classifier.classify(input)).toEqual(classifier.classify(input));
   });
+
+  it('does not carry metadata features into later classifications of the same description', () => {
+    const taskDescription = 'Update release notes';
+    const withHints = classifier.classify({ taskDescription, fileCount: 4, hints: { policy: 'complex' } });
+    const plain = classifier.classify({ taskDescription });
+
+    expect(withHints.features.some(feature => feature.name === 'hint:policy')).toBe(true);
+    expect(plain.features.map(feature => feature.name)).toEqual(['description_length', 'action_verb']);
+  });
 });
@@ -1,3 +1,4 @@
+import { setBoundedMapEntry } from '../cache/bounded-map.js';
 import type {
   ClassificationFeature,
   ClassificationResult,
@@ -32,6 +33,79 @@ function normalizeDescription(taskDescription: string): string {
   return taskDescription.trim().toLowerCase();
 }
 
+interface DescriptionFeatures {
+  readonly keywordFeatures: ReadonlyArray<ClassificationFeature>;
+  readonly shapeFeatures: ReadonlyArray<ClassificationFeature>;
+}
+
+const MAX_DESCRIPTION_FEATURE_CACHE_ENTRIES = 128;
+// Keyword, length and action-verb features depend only on the description text, and the
+// same task description is classified again every time the task is re-dispatched.
+const descriptionFeatureCache = new Map<string, DescriptionFeatures>();
+
+function extractDescriptionFeatures(description: string): DescriptionFeatures {
+  const cached = descriptionFeatureCache.get(description);
+  if (cached) {
+    return cached;
+  }
+
+  const keywordFeatures: ClassificationFeature[] = [];
+  for (const keyword of SIMPLE_KEYWORDS) {
+    if (!description.includes(keyword)) {
+      continue;
+    }
+    keywordFeatures.push({
+      name: 'keyword_match',
+      value: `simple:${keyword}`,
+      weight: -0.45,
+    });
+  }
+  for (const keyword of COMPLEX_KEYWORDS) {
+    if (!description.includes(keyword)) {
+      continue;
+    }
+    keywordFeatures.push({
+      name: 'keyword_match',
+      value: `complex:${keyword}`,
+      weight: 0.55,
+    });
+  }
+
+  const shapeFeatures: ClassificationFeature[] = [];
+  if (description.length < 100) {
+    shapeFeatures.push({
+      name: 'description_length',
+      value: description.length,
+      weight: -0.05,
+    });
+  } else if (description.length > 500) {
+    shapeFeatures.push({
+      name: 'description_length',
+      value: description.length,
+      weight: 0.2,
+    });
+  }
+
+  const firstWord = description.match(/^[a-z]+/)?.[0];
+  if (firstWord && SIMPLE_ACTION_VERBS.has(firstWord)) {
+    shapeFeatures.push({
+      name: 'action_verb',
+      value: firstWord,
+      weight: -0.25,
+    });
+  } else if (firstWord && COMPLEX_ACTION_VERBS.has(firstWord)) {
+    shapeFeatures.push({
+      name: 'action_verb',
+      value: firstWord,
+      weight: 0.3,
+    });
+  }
+
+  const extracted = { keywordFeatures, shapeFeatures };
+  setBoundedMapEntry(descriptionFeatureCache, description, extracted, MAX_DESCRIPTION_FEATURE_CACHE_ENTRIES);
+  return extracted;
+}
+
 function classifyScore(score: number): ComplexityLevel {
   if (score < -0.3) {
     return 'simple';
@@ -60,28 +134,8 @@ export class HeuristicComplexityClassifier implements ITaskComplexityClassifier
       };
     }
 
-    const features: ClassificationFeature[] = [];
-
-    for (const keyword of SIMPLE_KEYWORDS) {
-      if (!description.includes(keyword)) {
-        continue;
-      }
-      features.push({
-        name: 'keyword_match',
-        value: `simple:${keyword}`,
-        weight: -0.45,
-      });
-    }
-    for (const keyword of COMPLEX_KEYWORDS) {
-      if (!description.includes(keyword)) {
-        continue;
-      }
-      features.push({
-        name: 'keyword_match',
-        value: `complex:${keyword}`,
-        weight: 0.55,
-      });
-    }
+    const { keywordFeatures, shapeFeatures } = extractDescriptionFeatures(description);
+    const features: ClassificationFeature[] = [...keywordFeatures];
 
     if (typeof input.fileCount === 'number') {
       if (input.fileCount <= 1) {
@@ -114,34 +168,7 @@ export class HeuristicComplexityClassifier implements ITaskComplexityClassifier
       });
     }
 
-    if (description.length < 100) {
-      features.push({
-        name: 'description_length',
-        value: description.length,
-        weight: -0.05,
-      });
-    } else if (description.length > 500) {
-      features.push({
-        name: 'description_length',
-        value: description.length,
-        weight: 0.2,
-      });
-    }
-
-    const firstWord = description.match(/^[a-z]+/)?.[0];
-    if (firstWord && SIMPLE_ACTION_VERBS.has(firstWord)) {
-      features.push({
-        name: 'action_verb',
-        value: firstWord,
-        weight: -0.25,
-      });
-    } else if (firstWord && COMPLEX_ACTION_VERBS.has(firstWord)) {
-      features.push({
-        name: 'action_verb',
-        value: firstWord,
-        weight: 0.3,
-      });
-    }
+    features.push(...shapeFeatures);
 
     if (input.hints) {
       for (const [name, value] of Object.entries(input.hints)) {
@@ -1,8 +1,9 @@
 import type { ImplementerResult, ReviewerResult } from '../../tools/workflow/dispatch-contract-schemas.js';
 import { createFactId, IFactExtractor, SessionFact, SessionFactTag } from './types.js';
 
-type ImplementerExtractionRule = (result: ImplementerResult, taskId: string) => SessionFact[];
-type ReviewerExtractionRule = (result: ReviewerResult, taskId: string) => SessionFact[];
+// Rules yield facts straight into the caller's list instead of building one array per rule.
+type ImplementerExtractionRule = (result: ImplementerResult, taskId: string) => Iterable<SessionFact>;
+type ReviewerExtractionRule = (result: ReviewerResult, taskId: string) => Iterable<SessionFact>;
 
 function clipText(value: string, maxChars: number): string {
   if (maxChars <= 0) {
@@ -65,35 +66,41 @@ const implementerRules: ReadonlyArray<ImplementerExtractionRule> = [
       sourceRole: 'implementer',
     }),
   ],
-  (result, taskId) => {
+  function* (result, taskId) {
     if (!Array.isArray(result.files_changed)) {
-      return [];
+      return;
     }
-    return result.files_changed
-      .filter((file): file is string => typeof file === 'string' && file.length > 0)
-      .map(file => createSessionFact({
+    for (const file of result.files_changed) {
+      if (typeof file !== 'string' || file.length === 0) {
+        continue;
+      }
+      yield createSessionFact({
         subject: file,
         relation: 'modified_by',
         object: `task:${taskId}`,
         tag: 'file_change',
         sourceTaskId: taskId,
         sourceRole: 'implementer',
-      }));
+      });
+    }
   },
-  (result, taskId) => {
+  function* (result, taskId) {
     if (!Array.isArray(result.follow_up_actions)) {
-      return [];
+      return;
     }
-    return result.follow_up_actions
-      .filter((action): action is string => typeof action === 'string' && action.length > 0)
-      .map(action => createSessionFact({
+    for (const action of result.follow_up_actions) {
+      if (typeof action !== 'string' || action.length === 0) {
+        continue;
+      }
+      yield createSessionFact({
         subject: `task:${taskId}`,
         relation: 'requires',
         object: clipText(action, 120),
         tag: 'dependency',
         sourceTaskId: taskId,
         sourceRole: 'implementer',
-      }));
+      });
+    }
   },
 ];
 
@@ -108,48 +115,56 @@ const reviewerRules: ReadonlyArray<ReviewerExtractionRule> = [
       sourceRole: 'reviewer',
     }),
   ],
-  (result, taskId) => {
+  function* (result, taskId) {
     if (!Array.isArray(result.issues)) {
-      return [];
+      return;
+    }
+    for (const issue of result.issues) {
+      yield createSessionFact({
+        subject: issue.file ?? `task:${taskId}`,
+        relation: 'issue',
+        object: clipText(issue.message, 120),
+        tag: 'error',
+        sourceTaskId: taskId,
+        sourceRole: 'reviewer',
+      });
     }
-    return result.issues.map(issue => createSessionFact({
-      subject: issue.file ?? `task:${taskId}`,
-      relation: 'issue',
-      object: clipText(issue.message, 120),
-      tag: 'error',
-      sourceTaskId: taskId,
-      sourceRole: 'reviewer',
-    }));
   },
-  (result, taskId) => {
+  function* (result, taskId) {
     if (!Array.isArray(result.required_fixes)) {
-      return [];
+      return;
     }
-    return result.required_fixes
-      .filter((fix): fix is string => typeof fix === 'string' && fix.length > 0)
-      .map(fix => createSessionFact({
+    for (const fix of result.required_fixes) {
+      if (typeof fix !== 'string' || fix.length === 0) {
+        continue;
+      }
+      yield createSessionFact({
         subject: `task:${taskId}`,
         relation: 'must_fix',
         object: clipText(fix, 120),
         tag: 'convention',
         sourceTaskId: taskId,
         sourceRole: 'reviewer',
-      }));
+      });
+    }
   },
-  (result, taskId) => {
+  function* (result, taskId) {
     if (!Array.isArray(result.issues)) {
-      return [];
+      return;
     }
-    return result.issues
-      .filter(issue => hasConventionReference(issue))
-      .map(issue => createSessionFact({
+    for (const issue of result.issues) {
+      if (!hasConventionReference(issue)) {
+        continue;
+      }
+      yield createSessionFact({
         subject: issue.file ?? `task:${taskId}`,
         relation: 'convention',
         object: clipText(issue.message, 120),
         tag: 'convention',
         sourceTaskId: taskId,
         sourceRole: 'reviewer',
-      }));
+      });
+    }
   },
 ];
 
@@ -166,7 +181,9 @@ export class RuleBasedFactExtractor implements IFactExtractor {
     const facts: SessionFact[] = [];
     for (const rule of implementerRules) {
       try {
-        facts.push(...rule(result, taskId));
+        for (const fact of rule(result, taskId)) {
+          facts.push(fact);
+        }
       } catch (error) {
         console.warn('[session-fact-extractor] implementer rule failed', error);
       }
@@ -178,7 +195,9 @@ export class RuleBasedFactExtractor implements IFactExtractor {
     const facts: SessionFact[] = [];
     for (const rule of reviewerRules) {
       try {
-        facts.push(...rule(result, taskId));
+        for (const fact of rule(result, taskId)) {
+          facts.push(fact);
+        }
       } catch (error) {
         console.warn('[session-fact-extractor] reviewer rule failed', error);
       }
@@ -177,4 +177,36 @@ describe('KeywordFactRetriever', () => {
 
     expect(facts).toHaveLength(1);
   });
+
+  it('skips facts that exceed the remaining budget and keeps filling with smaller ones', () => {
+    const store = new InMemorySessionFactStore();
+    const retriever = new KeywordFactRetriever(store);
+    const large = buildFact({
+      subject: 'src/core/session/very-long-file-name-one.ts',
+      relation: 'modified_by',
+      object: 'task:1 very long object text to consume token budget quickly',
+      tags: ['file_change'],
+      sourceTaskId: '1',
+      at: '2025-01-03T00:00:00.000Z',
+    });
+    const small = buildFact({
+      subject: 'a.ts',
+      relation: 'modified_by',
+      object: 'task:2',
+      tags: ['file_change'],
+      sourceTaskId: '2',
+      at: '2025-01-02T00:00:00.000Z',
+    });
+    store.add([large, small]);
+
+    const facts = retriever.retrieve({
+      taskDescription: 'completely different words',
+      taskId: '9',
+      tags: undefined,
+      maxFacts: 10,
+      maxTokens: 20,
+    });
+
+    expect(facts).toEqual([small]);
+  });
 });
@@ -76,7 +76,7 @@ export class KeywordFactRetriever implements IFactRetriever {
     for (const fact of ranked) {
       const factTokens = estimateFactTokens(fact, tokenCharsPerToken);
       if (usedTokens + factTokens > query.maxTokens) {
-        break;
+        continue;
       }
       withinBudget.push(fact);
       usedTokens += factTokens;
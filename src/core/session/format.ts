@@ -2,27 +2,21 @@ import { SessionFact } from './types.js';
 
 const MAX_FACT_LINE_CHARS = 120;
 
-function truncateObjectForLine(input: {
-  subject: string;
-  relation: string;
-  object: string;
-  sourceTaskId: string;
-}): string {
+const CLIPPED_OBJECT_MARKER = '...';
+
+function truncateObjectForLine(input: Pick<SessionFact, 'subject' | 'relation' | 'object' | 'sourceTaskId'>): string {
   const prefix = `- ${input.subject} ${input.relation} `;
   const suffix = ` [task:${input.sourceTaskId}]`;
   const availableObjectChars = MAX_FACT_LINE_CHARS - prefix.length - suffix.length;
 
-  if (input.object.length <= availableObjectChars) {
-    return `${prefix}${input.object}${suffix}`;
-  }
-  if (availableObjectChars <= 0) {
-    return `${prefix}${suffix}`;
+  // Clip with a single slice and emit the line from one template on every path.
+  let object = input.object;
+  if (object.length > availableObjectChars) {
+    object = availableObjectChars > CLIPPED_OBJECT_MARKER.length
+      ? `${object.slice(0, availableObjectChars - CLIPPED_OBJECT_MARKER.length)}${CLIPPED_OBJECT_MARKER}`
+      : object.slice(0, Math.max(0, availableObjectChars));
   }
-  if (availableObjectChars <= 3) {
-    return `${prefix}${input.object.slice(0, availableObjectChars)}${suffix}`;
-  }
-  const clippedObject = `${input.object.slice(0, availableObjectChars - 3)}...`;
-  return `${prefix}${clippedObject}${suffix}`;
+  return `${prefix}${object}${suffix}`;
 }
 
 export function formatSessionFacts(facts: SessionFact[]): string {
@@ -30,12 +24,5 @@ export function formatSessionFacts(facts: SessionFact[]): string {
     return '';
   }
 
-  const lines = facts.map(fact => truncateObjectForLine({
-    subject: fact.subject,
-    relation: fact.relation,
-    object: fact.object,
-    sourceTaskId: fact.sourceTaskId,
-  }));
-
-  return ['[Session Context]', ...lines].join('\n');
+  return `[Session Context]\n${facts.map(truncateObjectForLine).join('\n')}`;
 }
@@ -1,6 +1,7 @@
 import { GraphSessionFactStore } from './graph-session-fact-store.js';
 import { KeywordFactRetriever, KEYWORD_STOPWORDS } from './fact-retriever.js';
 import type { FactQuery, IFactRetriever, SessionFact, SessionFactTag } from './types.js';
+import { escapeRegExp } from './regex.js';
 
 const TOKEN_SPLIT_REGEX = /[\s/\-_.,:;()[\]{}]+/;
 const DEFAULT_MAX_HOPS = 2;
@@ -139,21 +140,38 @@ export class GraphFactRetriever implements IFactRetriever {
       normalized: nodeKey.toLowerCase(),
     }));
 
+    // Tokens never contain '/', so an exact match is the whole key or its last path
+    // segment. Index nodes by both (in node order) to look each token up directly.
+    const nodesByExactKey = new Map<string, number[]>();
+    normalizedNodes.forEach((node, index) => {
+      const lastSegment = node.normalized.slice(node.normalized.lastIndexOf('/') + 1);
+      for (const key of new Set([node.normalized, lastSegment])) {
+        const indices = nodesByExactKey.get(key);
+        if (indices) {
+          indices.push(index);
+        } else {
+          nodesByExactKey.set(key, [index]);
+        }
+      }
+    });
+
     const exactMatches = new Set<string>();
     for (const token of tokens) {
-      for (const node of normalizedNodes) {
-        if (node.normalized === token || node.normalized.endsWith(`/${token}`)) {
-          exactMatches.add(node.nodeKey);
-        }
+      for (const index of nodesByExactKey.get(token) ?? []) {
+        exactMatches.add(normalizedNodes[index].nodeKey);
       }
     }
 
+    // One alternation pass per node finds the few candidates containing any token;
+    // only those are probed token by token to keep the token-major result order.
+    const anyTokenPattern = new RegExp(Array.from(tokens, escapeRegExp).join('|'));
+    const substringCandidates = normalizedNodes.filter(
+      node => !exactMatches.has(node.nodeKey) && anyTokenPattern.test(node.normalized)
+    );
+
     const substringMatches = new Set<string>();
     for (const token of tokens) {
-      for (const node of normalizedNodes) {
-        if (exactMatches.has(node.nodeKey)) {
-          continue;
-        }
+      for (const node of substringCandidates) {
         if (node.normalized.includes(token)) {
           substringMatches.add(node.nodeKey);
         }
@@ -175,11 +193,9 @@ export class GraphFactRetriever implements IFactRetriever {
       const visitedNodes = new Set<string>([startNode]);
       const queue: Array<{ nodeKey: string; hopDistance: number }> = [{ nodeKey: startNode, hopDistance: 0 }];
 
-      while (queue.length > 0) {
-        const next = queue.shift();
-        if (next === undefined) {
-          break;
-        }
+      // Walk the queue with a read cursor; shift() would re-index the array on every dequeue.
+      for (let head = 0; head < queue.length; head += 1) {
+        const next = queue[head];
 
         const edgeKeys = new Set<string>([
           ...graph.outboundEdges(next.nodeKey),
@@ -262,10 +278,12 @@ export class GraphFactRetriever implements IFactRetriever {
     const charsPerToken = Math.max(1, tokenCharsPerToken ?? DEFAULT_TOKEN_CHARS_PER_TOKEN);
     let consumedTokens = 0;
 
+    // Fill greedily in rank order: an oversized fact is skipped rather than
+    // ending selection, so it cannot crowd out smaller relevant facts.
     for (const fact of rankedFacts) {
       const requiredTokens = estimateFactTokens(fact, charsPerToken);
       if (consumedTokens + requiredTokens > maxTokens) {
-        break;
+        continue;
       }
       budgetedFacts.push(fact);
       consumedTokens += requiredTokens;
@@ -21,12 +21,15 @@ export interface GraphSessionFactStoreStats {
   readonly persistenceAvailable: boolean;
 }
 
+// A path separator anywhere, or a trailing file extension, marks the key as a file entity.
+const FILE_ENTITY_KEY_PATTERN = /[/\\]|\.[a-z0-9]+$/i;
+
 function inferEntityType(entityKey: string): EntityType {
   if (entityKey.startsWith('task:')) {
     return 'task';
   }
 
-  if (entityKey.includes('/') || entityKey.includes('\\') || /\.[a-z0-9]+$/i.test(entityKey)) {
+  if (FILE_ENTITY_KEY_PATTERN.test(entityKey)) {
     return 'file';
   }
 
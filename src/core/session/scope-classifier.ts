@@ -1,4 +1,5 @@
 import type { SessionFact } from './types.js';
+import { escapeRegExp } from './regex.js';
 
 export type ScopeClassification = 'local' | 'global';
 
@@ -16,23 +17,21 @@ const EXACT_CONFIG_FILENAMES = ['package.json', 'tsconfig.json', 'dockerfile'];
 const PREFIX_CONFIG_FILENAMES = ['.eslintrc', '.prettierrc', '.env', 'docker-compose'];
 const PREFIXED_CONFIG_FILENAMES = ['jest.config.', 'vitest.config.', 'webpack.config.', 'vite.config.'];
 
+// One anchored pattern instead of an includes() plus a startsWith() probe per prefix.
+const CONFIG_FILENAME_PATTERN = new RegExp(
+  `^(?:(?:${EXACT_CONFIG_FILENAMES.map(escapeRegExp).join('|')})$|${
+    [...PREFIX_CONFIG_FILENAMES, ...PREFIXED_CONFIG_FILENAMES].map(escapeRegExp).join('|')
+  })`
+);
+
 function getSubjectFileName(subject: string): string {
-  const normalizedPath = subject.trim().split('\\').join('/').toLowerCase();
-  const fileName = normalizedPath.split('/').at(-1);
-  return fileName ?? normalizedPath;
+  const normalizedPath = subject.trim().toLowerCase();
+  const lastSeparator = Math.max(normalizedPath.lastIndexOf('/'), normalizedPath.lastIndexOf('\\'));
+  return normalizedPath.slice(lastSeparator + 1);
 }
 
 function isConfigFileSubject(subject: string): boolean {
-  const fileName = getSubjectFileName(subject);
-
-  if (EXACT_CONFIG_FILENAMES.includes(fileName)) {
-    return true;
-  }
-  if (PREFIX_CONFIG_FILENAMES.some(prefix => fileName.startsWith(prefix))) {
-    return true;
-  }
-
-  return PREFIXED_CONFIG_FILENAMES.some(prefix => fileName.startsWith(prefix));
+  return CONFIG_FILENAME_PATTERN.test(getSubjectFileName(subject));
 }
 
 const SCOPE_RULES: ReadonlyArray<ScopeRule> = [
@@ -1,5 +1,5 @@
 import Database from 'better-sqlite3';
-import { chmodSync, closeSync, existsSync, mkdirSync, openSync, statSync } from 'node:fs';
+import { chmodSync, mkdirSync, statSync, writeFileSync } from 'node:fs';
 import { dirname, resolve } from 'node:path';
 import type { SessionFact, SessionFactTag } from './types.js';
 
@@ -219,11 +219,14 @@ DELETE FROM facts
 WHERE valid_to IS NOT NULL
   AND valid_to < ?`;
 
-export const SQL_COUNT_TOTAL_FACTS = 'SELECT COUNT(*) AS total FROM facts';
-export const SQL_COUNT_VALID_FACTS = 'SELECT COUNT(*) AS total FROM facts WHERE valid_to IS NULL';
-export const SQL_COUNT_GLOBAL_FACTS = "SELECT COUNT(*) AS total FROM facts WHERE valid_to IS NULL AND scope = 'global'";
-export const SQL_COUNT_LOCAL_FACTS = "SELECT COUNT(*) AS total FROM facts WHERE valid_to IS NULL AND scope = 'local'";
-export const SQL_COUNT_ENTITIES = 'SELECT COUNT(*) AS total FROM entities';
+export const SQL_SELECT_STATS = `
+SELECT
+  COUNT(*) AS total_facts,
+  COUNT(CASE WHEN valid_to IS NULL THEN 1 END) AS valid_facts,
+  COUNT(CASE WHEN valid_to IS NULL AND scope = 'global' THEN 1 END) AS global_facts,
+  COUNT(CASE WHEN valid_to IS NULL AND scope = 'local' THEN 1 END) AS local_facts,
+  (SELECT COUNT(*) FROM entities) AS entities
+FROM facts`;
 
 interface SQLiteSelectedFactRow {
   readonly id: string;
@@ -238,15 +241,22 @@ interface SQLiteSelectedFactRow {
   readonly confidence: number;
 }
 
-interface SQLiteCountRow {
-  readonly total: number;
+interface SQLiteStatsRow {
+  readonly total_facts: number;
+  readonly valid_facts: number;
+  readonly global_facts: number;
+  readonly local_facts: number;
+  readonly entities: number;
 }
 
+// Any path separator or dot marks the key as a file entity.
+const FILE_ENTITY_KEY_PATTERN = /[/\\.]/;
+
 function inferEntityType(entityKey: string): EntityType {
   if (entityKey.startsWith('task:')) {
     return 'task';
   }
-  if (entityKey.includes('/') || entityKey.includes('\\') || entityKey.includes('.')) {
+  if (FILE_ENTITY_KEY_PATTERN.test(entityKey)) {
     return 'file';
   }
   return 'concept';
@@ -419,12 +429,13 @@ export class SQLiteFactAdapter implements ISQLiteFactAdapter {
       };
     }
 
+    const row = db.prepare<[], SQLiteStatsRow>(SQL_SELECT_STATS).get()!;
     return {
-      totalFacts: this.count(db, SQL_COUNT_TOTAL_FACTS),
-      validFacts: this.count(db, SQL_COUNT_VALID_FACTS),
-      globalFacts: this.count(db, SQL_COUNT_GLOBAL_FACTS),
-      localFacts: this.count(db, SQL_COUNT_LOCAL_FACTS),
-      entities: this.count(db, SQL_COUNT_ENTITIES),
+      totalFacts: row.total_facts,
+      validFacts: row.valid_facts,
+      globalFacts: row.global_facts,
+      localFacts: row.local_facts,
+      entities: row.entities,
     };
   }
 
@@ -435,19 +446,13 @@ export class SQLiteFactAdapter implements ISQLiteFactAdapter {
 
   private ensureDatabaseFile(): void {
     mkdirSync(dirname(this.databasePath), { recursive: true });
-    if (existsSync(this.databasePath)) {
-      if (statSync(this.databasePath).isDirectory()) {
-        throw new Error(`Database path must be a file: ${this.databasePath}`);
-      }
-    } else {
-      const fd = openSync(this.databasePath, 'w', 0o600);
-      closeSync(fd);
+    // One stat answers both "does it exist" and "is it a directory".
+    const stats = statSync(this.databasePath, { throwIfNoEntry: false });
+    if (!stats) {
+      writeFileSync(this.databasePath, '', { mode: 0o600 });
+    } else if (stats.isDirectory()) {
+      throw new Error(`Database path must be a file: ${this.databasePath}`);
     }
     chmodSync(this.databasePath, 0o600);
   }
-
-  private count(db: Database.Database, sql: string): number {
-    const row = db.prepare<[], SQLiteCountRow>(sql).get();
-    return row!.total;
-  }
 }
@@ -9,16 +9,16 @@ export async function validateProjectPath(projectPath: string): Promise<string>
       throw new Error('Invalid project path: path must be a non-empty string');
     }
 
+    // resolve() normalizes as well, so one call serves both the traversal
+    // check and the returned absolute path.
+    const absolutePath = resolve(projectPath);
     if (projectPath.includes('..') || projectPath.includes('~')) {
       const normalized = normalize(projectPath);
-      const resolved = resolve(normalized);
-      const cwd = process.cwd();
-      if (normalized.includes('..') && !resolved.startsWith(cwd)) {
+      if (normalized.includes('..') && !absolutePath.startsWith(process.cwd())) {
         throw new Error(`Path traversal detected: ${projectPath}`);
       }
     }
 
-    const absolutePath = resolve(projectPath);
     const systemPaths = ['/etc', '/usr', '/bin', '/sbin', '/var', '/sys', '/proc'];
     const windowsSystemPaths = ['C:\\Windows', 'C:\\Program Files', 'C:\\Program Files (x86)'];
     const allSystemPaths = process.platform === 'win32' ? windowsSystemPaths : systemPaths;
@@ -29,7 +29,7 @@ export async function validateProjectPath(projectPath: string): Promise<string>
       }
     }
 
-    await access(absolutePath, constants.F_OK);
+    // stat() rejects with ENOENT for missing paths, so no separate existence probe.
     const stats = await stat(absolutePath);
     if (!stats.isDirectory()) {
       throw new Error(`Project path is not a directory: ${absolutePath}`);
@@ -51,22 +51,10 @@ export async function validateProjectPath(projectPath: string): Promise<string>
   }
 }
 
-export async function ensureDirectoryExists(dirPath: string): Promise<void> {
-  try {
-    await access(dirPath, constants.F_OK);
-  } catch (error) {
-    if (typeof error === 'object' && error !== null && 'code' in error && (error as { code?: unknown }).code === 'ENOENT') {
-      await mkdir(dirPath, { recursive: true });
-      return;
-    }
-    throw error;
-  }
-}
-
 export async function ensureWorkflowDirectory(projectPath: string): Promise<string> {
   const workflowRoot = PathUtils.getWorkflowRoot(projectPath);
-  const directories = [
-    workflowRoot,
+  // Leaf directories only: recursive mkdir creates the workflow root and archive parent.
+  const leafDirectories = [
     PathUtils.getSpecPath(projectPath, ''),
     PathUtils.getArchiveSpecsPath(projectPath),
     PathUtils.getSteeringPath(projectPath),
@@ -75,8 +63,8 @@ export async function ensureWorkflowDirectory(projectPath: string): Promise<stri
     PathUtils.getCommandsPath(projectPath),
   ];
 
-  for (const dir of directories) {
-    await ensureDirectoryExists(dir);
+  for (const dir of leafDirectories) {
+    await mkdir(dir, { recursive: true });
   }
 
   return workflowRoot;
@@ -1,4 +1,17 @@
 import { join, normalize, sep, resolve, posix } from 'path';
+import { setBoundedMapEntry } from '../cache/bounded-map.js';
+
+/** A path prefix in comparison form, normalized once when the config is read */
+interface ComparablePrefix {
+  normalized: string;
+  comparable: string;
+}
+
+/**
+ * Anything posix.normalize (plus trailing-slash removal) would change: backslashes,
+ * doubled slashes, "." or ".." segments, or a trailing slash after a non-root path.
+ */
+const NEEDS_COMPARISON_NORMALIZATION = /\\|\/\/|(?:^|\/)\.\.?(?:\/|$)|.\/$/;
 
 export class PathUtils {
   /** macOS and Windows are case-insensitive filesystems */
@@ -6,13 +19,20 @@ export class PathUtils {
     process.platform === 'darwin' || process.platform === 'win32';
 
   /** Cached path configuration (undefined = not checked, null = invalid/missing) */
-  private static pathConfig: { hostPrefix: string; containerPrefix: string } | null | undefined;
+  private static pathConfig: { hostPrefix: ComparablePrefix; containerPrefix: ComparablePrefix } | null | undefined;
+
+  private static readonly MAX_TRANSLATED_PATH_CACHE_ENTRIES = 256;
+  /**
+   * Host-to-container translations for the cached path config. Tool calls translate
+   * the same few project paths over and over, so each is normalized only once.
+   */
+  private static translatedPathCache = new Map<string, string>();
 
   /**
    * Get cached path configuration from environment variables.
    * Caches result to prevent race conditions from env var changes mid-operation.
    */
-  private static getPathConfig(): { hostPrefix: string; containerPrefix: string } | null {
+  private static getPathConfig(): { hostPrefix: ComparablePrefix; containerPrefix: ComparablePrefix } | null {
     if (this.pathConfig !== undefined) {
       return this.pathConfig;
     }
@@ -39,7 +59,10 @@ export class PathUtils {
       return null;
     }
 
-    this.pathConfig = { hostPrefix, containerPrefix };
+    this.pathConfig = {
+      hostPrefix: this.toComparablePrefix(hostPrefix),
+      containerPrefix: this.toComparablePrefix(containerPrefix),
+    };
     return this.pathConfig;
   }
 
@@ -51,6 +74,7 @@ export class PathUtils {
   /** Reset cached config (for testing) */
   static resetPathConfig(): void {
     this.pathConfig = undefined;
+    this.translatedPathCache.clear();
   }
 
   /**
@@ -58,6 +82,10 @@ export class PathUtils {
    * Converts backslashes to forward slashes, removes trailing slashes.
    */
   private static normalizeForComparison(p: string): string {
+    // Fast path: most paths are already clean, so return them untouched
+    if (p !== '' && !NEEDS_COMPARISON_NORMALIZATION.test(p)) {
+      return p;
+    }
     // Convert to Unix-style, then use built-in posix.normalize
     const unixStyle = p.replace(/\\/g, '/');
     // posix.normalize handles /./, /../, and // but keeps trailing slash
@@ -68,29 +96,54 @@ export class PathUtils {
       : normalized;
   }
 
+  private static toComparablePrefix(prefix: string): ComparablePrefix {
+    const normalized = this.normalizeForComparison(prefix);
+    return {
+      normalized,
+      comparable: this.IS_CASE_INSENSITIVE ? normalized.toLowerCase() : normalized,
+    };
+  }
+
   /**
-   * Check if a path matches a prefix with proper boundary checking.
+   * Return the part of a path below a prefix, with proper boundary checking,
+   * or null when the path is not under the prefix.
    * - Prevents partial matches like "/Users/dev" matching "/Users/developer"
    * - Handles case-insensitivity on macOS/Windows
    * - Normalizes path separators for cross-platform support
+   * The returned remainder is empty for an exact match and otherwise keeps the
+   * path's original casing; it starts with "/" except under the root prefix.
    */
-  private static pathMatchesPrefix(path: string, prefix: string): boolean {
-    let normalizedPath = this.normalizeForComparison(path);
-    let normalizedPrefix = this.normalizeForComparison(prefix);
+  private static relativeToPrefix(path: string, prefix: ComparablePrefix): string | null {
+    const normalizedPath = this.normalizeForComparison(path);
+    const comparablePath = this.IS_CASE_INSENSITIVE ? normalizedPath.toLowerCase() : normalizedPath;
+    const { normalized: normalizedPrefix, comparable: comparablePrefix } = prefix;
+
+    const matches = comparablePath === comparablePrefix
+      // Special case: root prefix "/" matches any absolute path
+      || (comparablePrefix === '/' ? comparablePath.startsWith('/') : comparablePath.startsWith(comparablePrefix + '/'));
+    return matches ? normalizedPath.substring(normalizedPrefix.length) : null;
+  }
 
-    if (this.IS_CASE_INSENSITIVE) {
-      normalizedPath = normalizedPath.toLowerCase();
-      normalizedPrefix = normalizedPrefix.toLowerCase();
-    }
+  /**
+   * Re-root a path from one prefix to another, or return null when the path
+   * is not under the source prefix.
+   */
+  private static swapPrefix(path: string, fromPrefix: ComparablePrefix, toPrefix: ComparablePrefix): string | null {
+    let relativePath = this.relativeToPrefix(path, fromPrefix);
+    if (relativePath === null) return null;
 
-    if (normalizedPath === normalizedPrefix) return true;
+    // Ensure relative path starts with separator (needed for root prefix case)
+    if (relativePath && !relativePath.startsWith('/')) {
+      relativePath = '/' + relativePath;
+    }
+    const result = toPrefix.normalized + relativePath;
 
-    // Special case: root prefix "/" matches any absolute path
-    if (normalizedPrefix === '/') {
-      return normalizedPath.startsWith('/');
+    // Security: Validate no directory traversal in result
+    if (result.includes('/../') || result.endsWith('/..')) {
+      throw new Error('Path translation resulted in directory traversal attempt');
     }
 
-    return normalizedPath.startsWith(normalizedPrefix + '/');
+    return result;
   }
 
   /**
@@ -107,27 +160,12 @@ export class PathUtils {
     const config = this.getPathConfig();
     if (!config) return hostPath;
 
-    if (this.pathMatchesPrefix(hostPath, config.hostPrefix)) {
-      const normalizedHostPrefix = this.normalizeForComparison(config.hostPrefix);
-      const normalizedPath = this.normalizeForComparison(hostPath);
-      const normalizedContainerPrefix = this.normalizeForComparison(config.containerPrefix);
+    const cached = this.translatedPathCache.get(hostPath);
+    if (cached !== undefined) return cached;
 
-      // Get relative path preserving structure
-      let relativePath = normalizedPath.substring(normalizedHostPrefix.length);
-      // Ensure relative path starts with separator (needed for root prefix case)
-      if (relativePath && !relativePath.startsWith('/')) {
-        relativePath = '/' + relativePath;
-      }
-      const result = normalizedContainerPrefix + relativePath;
-
-      // Security: Validate no directory traversal in result
-      if (result.includes('/../') || result.endsWith('/..')) {
-        throw new Error('Path translation resulted in directory traversal attempt');
-      }
-
-      return result;
-    }
-    return hostPath;
+    const translated = this.swapPrefix(hostPath, config.hostPrefix, config.containerPrefix) ?? hostPath;
+    setBoundedMapEntry(this.translatedPathCache, hostPath, translated, this.MAX_TRANSLATED_PATH_CACHE_ENTRIES);
+    return translated;
   }
 
   /**
@@ -137,27 +175,7 @@ export class PathUtils {
     const config = this.getPathConfig();
     if (!config) return containerPath;
 
-    if (this.pathMatchesPrefix(containerPath, config.containerPrefix)) {
-      const normalizedContainerPrefix = this.normalizeForComparison(config.containerPrefix);
-      const normalizedPath = this.normalizeForComparison(containerPath);
-      const normalizedHostPrefix = this.normalizeForComparison(config.hostPrefix);
-
-      // Get relative path preserving structure
-      let relativePath = normalizedPath.substring(normalizedContainerPrefix.length);
-      // Ensure relative path starts with separator (needed for root prefix case)
-      if (relativePath && !relativePath.startsWith('/')) {
-        relativePath = '/' + relativePath;
-      }
-      const result = normalizedHostPrefix + relativePath;
-
-      // Security: Validate no directory traversal in result
-      if (result.includes('/../') || result.endsWith('/..')) {
-        throw new Error('Path translation resulted in directory traversal attempt');
-      }
-
-      return result;
-    }
-    return containerPath;
+    return this.swapPrefix(containerPath, config.containerPrefix, config.hostPrefix) ?? containerPath;
   }
 
   /**
@@ -177,6 +195,15 @@ export class PathUtils {
     }
     
     const joined = normalize(join(basePath, ...paths));
+
+    // The segments were checked for ".." above, so a join that still starts with the
+    // normalized base cannot have escaped it; skip the two resolve() calls.
+    const normalizedBase = normalize(basePath);
+    const basePrefix = normalizedBase.endsWith(sep) ? normalizedBase : normalizedBase + sep;
+    if (joined === normalizedBase || joined.startsWith(basePrefix)) {
+      return joined;
+    }
+
     const resolvedBase = resolve(basePath);
     const resolvedJoined = resolve(joined);
     
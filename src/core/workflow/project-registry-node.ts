@@ -31,8 +31,8 @@ export class ProjectRegistry {
   }
 
   private async readRegistry(): Promise<Map<string, ProjectRegistryEntry>> {
-    await this.ensureRegistryDir();
-
+    // Reads do not need the directory: a missing file is an empty registry, and
+    // writeRegistry creates the directory before the first write.
     try {
       const content = await fs.readFile(this.registryPath, 'utf-8');
       const trimmedContent = content.trim();
@@ -3,6 +3,10 @@
  * Provides consistent task parsing across all components
  */
 
+// Keys that may follow preamble text in the first section of a structured prompt
+const KNOWN_PROMPT_KEY_PATTERNS = ['Role', 'Task', 'Context', 'Instructions', 'Requirements', 'Leverage', 'Success', 'Restrictions']
+  .map(key => new RegExp(`\\b${key}:`, 'i'));
+
 /**
  * Parse a prompt string into structured sections if it contains pipe separators
  * @param promptText The raw prompt text
@@ -36,11 +40,9 @@ function parseStructuredPrompt(promptText: string): PromptSection[] | undefined
     // Special handling for the first part - it might contain preamble text before the first key
     if (i === 0) {
       // Look for the last occurrence of a known key pattern in the first part
-      const knownKeys = ['Role', 'Task', 'Context', 'Instructions', 'Requirements', 'Leverage', 'Success', 'Restrictions'];
       let lastKeyIndex = -1;
       
-      for (const key of knownKeys) {
-        const keyPattern = new RegExp(`\\b${key}:`, 'i');
+      for (const keyPattern of KNOWN_PROMPT_KEY_PATTERNS) {
         const match = part.match(keyPattern);
         if (match && match.index !== undefined && match.index > lastKeyIndex) {
           lastKeyIndex = match.index;
@@ -150,6 +152,12 @@ const TASK_STATUS_TO_CHECKBOX_STATUS: Record<ParsedTask['status'], 'x' | '-' | '
   pending: ' ',
 };
 
+// One pass per line: detects any checkbox (- or * marker) and captures the task text when present
+const CHECKBOX_LINE_PATTERN = /^(\s*)([-*])\s+\[([ x\-])\](?:\s+(.+))?/;
+// Match patterns like "1. Description", "1.1 Description", "2.1. Description" etc
+// Also handles escaped periods from MDXEditor: "1\. Description"
+const TASK_ID_PATTERN = /^(\d+(?:\.\d+)*)\s*\\?\.?\s+(.+)/;
+
 /**
  * Parse tasks from markdown content
  * Handles any checkbox format at any indentation level
@@ -159,36 +167,33 @@ export function parseTasksFromMarkdown(content: string): TaskParserResult {
   const tasks: ParsedTask[] = [];
   let inProgressTask: string | null = null;
   
-  // Find all lines with checkboxes (supports both - and * list markers)
-  const checkboxIndices: number[] = [];
+  // Find all lines with checkboxes, keeping the match so task lines are not re-parsed
+  const checkboxMatches: Array<{ lineNumber: number; match: RegExpExecArray }> = [];
   for (let i = 0; i < lines.length; i++) {
-    if (lines[i].match(/^\s*[-*]\s+\[([ x\-])\]/)) {
-      checkboxIndices.push(i);
+    // Cheap gate: most markdown lines have no bracket and can skip the regex entirely
+    if (!lines[i].includes('[')) continue;
+    const match = CHECKBOX_LINE_PATTERN.exec(lines[i]);
+    if (match) {
+      checkboxMatches.push({ lineNumber: i, match });
     }
   }
   
   // Process each checkbox task
-  for (let idx = 0; idx < checkboxIndices.length; idx++) {
-    const lineNumber = checkboxIndices[idx];
-    const endLine = idx < checkboxIndices.length - 1 ? checkboxIndices[idx + 1] : lines.length;
-    
-    const line = lines[lineNumber];
-    const checkboxMatch = line.match(/^(\s*)([-*])\s+\[([ x\-])\]\s+(.+)/);
-    
-    if (!checkboxMatch) continue;
+  for (let idx = 0; idx < checkboxMatches.length; idx++) {
+    const { lineNumber, match: checkboxMatch } = checkboxMatches[idx];
+    const endLine = idx < checkboxMatches.length - 1 ? checkboxMatches[idx + 1].lineNumber : lines.length;
 
     const indent = checkboxMatch[1];
-    const listMarker = checkboxMatch[2]; // '-' or '*'
     const statusChar = checkboxMatch[3];
     const taskText = checkboxMatch[4];
     
+    if (taskText === undefined) continue;
+    
     // Determine status
     const status = CHECKBOX_STATUS_TO_TASK_STATUS[statusChar as 'x' | '-' | ' '];
     
     // Extract task ID and description
-    // Match patterns like "1. Description", "1.1 Description", "2.1. Description" etc
-    // Also handles escaped periods from MDXEditor: "1\. Description"
-    const taskMatch = taskText.match(/^(\d+(?:\.\d+)*)\s*\\?\.?\s+(.+)/);
+    const taskMatch = TASK_ID_PATTERN.exec(taskText);
     
     let taskId: string;
     let description: string;
@@ -224,8 +229,7 @@ export function parseTasksFromMarkdown(content: string): TaskParserResult {
         } else {
           // If no closing underscore on same line, capture multi-line
           const afterPrompt = contentLine.match(/_Prompt:\s*(.+)$/);
-          let promptText = afterPrompt ? afterPrompt[1] : '';
-          promptText = promptText.replace(/_$/, '').trim();
+          const promptParts = [(afterPrompt ? afterPrompt[1] : '').replace(/_$/, '').trim()];
 
           // Accumulate continuation lines that are not new bullets/metadata
           let j = lineIdx + 1;
@@ -240,23 +244,21 @@ export function parseTasksFromMarkdown(content: string): TaskParserResult {
             ) {
               break;
             }
-            promptText += ' ' + nextTrim.replace(/_$/, '').trim();
+            promptParts.push(nextTrim.replace(/_$/, '').trim());
             j++;
           }
-          prompt = promptText;
+          prompt = promptParts.join(' ');
           // Skip consumed continuation lines
           lineIdx = j - 1;
         }
-      } else if (contentLine.includes('_Requirements:') && !contentLine.includes('_Prompt:')) {
-        // Only process if not inside a prompt
+      } else if (contentLine.includes('_Requirements:')) {
         const reqMatch = contentLine.match(/_Requirements:\s*([^_]+?)_/);
         if (reqMatch) {
           const reqText = reqMatch[1].trim();
           // Split by comma and filter out empty/NFR
           requirements.push(...reqText.split(',').map(r => r.trim()).filter(r => r && r !== 'NFR'));
         }
-      } else if (contentLine.includes('_Leverage:') && !contentLine.includes('_Prompt:')) {
-        // Only process if not inside a prompt
+      } else if (contentLine.includes('_Leverage:')) {
         const levMatch = contentLine.match(/_Leverage:\s*([^_]+?)_/);
         if (levMatch) {
           const levText = levMatch[1].trim();
@@ -277,7 +279,7 @@ export function parseTasksFromMarkdown(content: string): TaskParserResult {
         const bulletContent = contentLine.replace(/^[-*]\s+/, '').trim();
         if (bulletContent.startsWith('Purpose:')) {
           purposes.push(bulletContent.substring(8).trim());
-        } else if (!bulletContent.match(/^Files?:/) && !bulletContent.match(/^Purpose:/)) {
+        } else {
           implementationDetails.push(bulletContent);
         }
       }
@@ -355,20 +357,21 @@ export function updateTaskStatus(
   // Find and update the task line
   for (let i = 0; i < lines.length; i++) {
     const line = lines[i];
+    if (!line.includes('[')) {
+      continue;
+    }
 
     // Match checkbox line with task ID in the description (supports both - and * list markers)
     // Pattern: - [x] 1.1 Task description  or  * [x] 1.1 Task description
-    const checkboxMatch = line.match(/^(\s*)([-*])\s+\[([ x\-])\]\s+(.+)/);
+    const checkboxMatch = CHECKBOX_LINE_PATTERN.exec(line);
 
-    if (checkboxMatch) {
+    if (checkboxMatch && checkboxMatch[4] !== undefined) {
       const prefix = checkboxMatch[1];
       const listMarker = checkboxMatch[2]; // Preserve original list marker
       const taskText = checkboxMatch[4];
 
       // Check if this line contains our target task ID
-      // Match patterns like "1. Description", "1.1 Description", "2.1. Description" etc
-      // Also handles escaped periods from MDXEditor: "1\. Description"
-      const taskMatch = taskText.match(/^(\d+(?:\.\d+)*)\s*\\?\.?\s+(.+)/);
+      const taskMatch = TASK_ID_PATTERN.exec(taskText);
 
       if (taskMatch && taskMatch[1] === taskId) {
         // Reconstruct the line with new status, preserving the original list marker
@@ -23,6 +23,9 @@ export interface ValidationResult {
   };
 }
 
+const REQUIRED_PROMPT_SECTIONS = ['Role', 'Task', 'Restrictions', 'Success'] as const;
+type RequiredPromptSection = (typeof REQUIRED_PROMPT_SECTIONS)[number];
+
 /**
  * Validate tasks.md content against required format
  * @param content The markdown content to validate
@@ -38,7 +41,7 @@ export function validateTasksMarkdown(content: string): ValidationResult {
   // Find all checkbox lines and their ranges (including malformed ones with asterisks)
   const checkboxIndices: number[] = [];
   for (let i = 0; i < lines.length; i++) {
-    if (lines[i].match(/^\s*[-*]\s*\[/)) {
+    if (lines[i].includes('[') && /^\s*[-*]\s*\[/.test(lines[i])) {
       checkboxIndices.push(i);
     }
   }
@@ -117,7 +120,7 @@ export function validateTasksMarkdown(content: string): ValidationResult {
     // 3. Validate metadata in following lines
     let hasPrompt = false;
     let promptHasClosingUnderscore = false;
-    let promptSections: string[] = [];
+    const promptSections = new Set<RequiredPromptSection>();
 
     for (let lineIdx = lineIndex + 1; lineIdx < endLine; lineIdx++) {
       const contentLine = lines[lineIdx];
@@ -182,10 +185,10 @@ export function validateTasksMarkdown(content: string): ValidationResult {
         const promptContent = trimmedLine.replace(/_Prompt:\s*/, '').replace(/_$/, '');
 
         // Check for required prompt sections: Role, Task, Restrictions, Success
-        const requiredSections = ['Role', 'Task', 'Restrictions', 'Success'];
-        for (const section of requiredSections) {
-          if (promptContent.toLowerCase().includes(section.toLowerCase() + ':')) {
-            promptSections.push(section);
+        const lowerPromptContent = promptContent.toLowerCase();
+        for (const section of REQUIRED_PROMPT_SECTIONS) {
+          if (lowerPromptContent.includes(section.toLowerCase() + ':')) {
+            promptSections.add(section);
           }
         }
       }
@@ -205,8 +208,7 @@ export function validateTasksMarkdown(content: string): ValidationResult {
       }
 
       // Check for missing prompt sections
-      const requiredSections = ['Role', 'Task', 'Restrictions', 'Success'];
-      const missingSections = requiredSections.filter(s => !promptSections.includes(s));
+      const missingSections = REQUIRED_PROMPT_SECTIONS.filter(s => !promptSections.has(s));
       if (missingSections.length > 0) {
         warnings.push({
           line: lineNum,
@@ -56,9 +56,8 @@ export class WorkspaceInitializer {
       'principles-template'
     ];
     
-    for (const template of templates) {
-      await this.copyTemplate(template, templatesDir);
-    }
+    // Each template is an independent read/write pair, so copy them concurrently.
+    await Promise.all(templates.map(template => this.copyTemplate(template, templatesDir)));
   }
   
   private async copyTemplate(templateName: string, targetDir: string): Promise<void> {
@@ -68,8 +67,11 @@ export class WorkspaceInitializer {
     
     const sourcePath = join(__dirname, '..', '..', 'templates', `${templateName}.md`);
 
-    const content = await fs.readFile(sourcePath, 'utf-8');
-    await fs.writeFile(targetPath, content, 'utf-8');
+    // Templates are copied verbatim, so move the raw bytes without a UTF-8 decode/encode
+    // round-trip. writeFile (unlike copyFile) gives the target a default writable mode, so
+    // re-initializing from a read-only install still overwrites it.
+    const content = await fs.readFile(sourcePath);
+    await fs.writeFile(targetPath, content);
   }
   
   private async createUserTemplatesReadme(): Promise<void> {
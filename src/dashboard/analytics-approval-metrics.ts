@@ -26,6 +26,13 @@ export interface ApprovalMetricsResponse extends AnalyticsResponseBase {
   dailyLatency: DailyLatencyPoint[];
 }
 
+const COUNT_KEY_BY_STATUS: ReadonlyMap<string, keyof ApprovalMetricsResponse['countsByStatus']> = new Map([
+  ['pending', 'pending'],
+  ['approved', 'approved'],
+  ['rejected', 'rejected'],
+  ['needs-revision', 'needsRevision'],
+]);
+
 function computeMedian(values: number[]): number | null {
   if (values.length === 0) {
     return null;
@@ -82,14 +89,9 @@ export function buildApprovalMetrics(input: {
 
     const createdDay = createdAt ? toUtcDayKey(createdAt) : null;
     if (createdDay && createdDay >= window.startDate && createdDay <= window.endDate) {
-      if (approval.status === 'pending') {
-        countsByStatus.pending += 1;
-      } else if (approval.status === 'approved') {
-        countsByStatus.approved += 1;
-      } else if (approval.status === 'rejected') {
-        countsByStatus.rejected += 1;
-      } else if (approval.status === 'needs-revision') {
-        countsByStatus.needsRevision += 1;
+      const countKey = approval.status ? COUNT_KEY_BY_STATUS.get(approval.status) : undefined;
+      if (countKey) {
+        countsByStatus[countKey] += 1;
       }
     }
 
@@ -122,10 +124,12 @@ export function buildApprovalMetrics(input: {
       resolvedRejectedCount += 1;
     }
 
-    if (!dailyDurationsByDate.has(respondedDay)) {
-      dailyDurationsByDate.set(respondedDay, []);
+    const dailyDurations = dailyDurationsByDate.get(respondedDay);
+    if (dailyDurations) {
+      dailyDurations.push(duration);
+    } else {
+      dailyDurationsByDate.set(respondedDay, [duration]);
     }
-    dailyDurationsByDate.get(respondedDay)!.push(duration);
   }
 
   for (const point of dailyLatency) {
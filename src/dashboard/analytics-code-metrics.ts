@@ -4,6 +4,10 @@ import { resolveAnalyticsWindow, type AnalyticsResponseBase } from './analytics-
 
 const execFileAsync = promisify(execFile);
 
+// A directory that is a git work tree stays one for the life of the dashboard,
+// so only the first metrics request per project pays for the rev-parse spawn.
+const knownGitWorkTrees = new Set<string>();
+
 export interface CodeMetricsPoint {
   date: string;
   linesAdded: number;
@@ -50,7 +54,10 @@ export async function buildCodeMetrics(input: {
   const pointsByDate = new Map(points.map((point) => [point.date, point]));
 
   try {
-    await execFileAsync('git', ['rev-parse', '--is-inside-work-tree'], { cwd: input.projectPath });
+    if (!knownGitWorkTrees.has(input.projectPath)) {
+      await execFileAsync('git', ['rev-parse', '--is-inside-work-tree'], { cwd: input.projectPath });
+      knownGitWorkTrees.add(input.projectPath);
+    }
   } catch (error) {
     if (isGitRepositoryError(error) || (typeof error === 'object' && error !== null && 'code' in error)) {
       return {
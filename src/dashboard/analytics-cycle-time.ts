@@ -31,11 +31,11 @@ function computeAverage(values: number[]): number | null {
   return Math.round(values.reduce((sum, value) => sum + value, 0) / values.length);
 }
 
-function computeMedian(values: number[]): number | null {
-  if (values.length === 0) {
+// Median and percentile expect values already sorted ascending, so one sort serves both.
+function computeMedian(sorted: number[]): number | null {
+  if (sorted.length === 0) {
     return null;
   }
-  const sorted = [...values].sort((a, b) => a - b);
   const middle = Math.floor(sorted.length / 2);
   if (sorted.length % 2 === 0) {
     return Math.round((sorted[middle - 1] + sorted[middle]) / 2);
@@ -43,11 +43,10 @@ function computeMedian(values: number[]): number | null {
   return sorted[middle];
 }
 
-function computePercentile(values: number[], percentile: number): number | null {
-  if (values.length === 0) {
+function computePercentile(sorted: number[], percentile: number): number | null {
+  if (sorted.length === 0) {
     return null;
   }
-  const sorted = [...values].sort((a, b) => a - b);
   const index = Math.ceil((percentile / 100) * sorted.length) - 1;
   const boundedIndex = Math.max(0, Math.min(sorted.length - 1, index));
   return sorted[boundedIndex];
@@ -84,10 +83,12 @@ export function buildCycleTimeAnalytics(input: {
   const taskEventsById = new Map<string, ParsedEvent[]>();
   for (const parsed of parsedEvents) {
     const key = `${parsed.event.specName}::${parsed.event.taskId}`;
-    if (!taskEventsById.has(key)) {
-      taskEventsById.set(key, []);
+    const taskEvents = taskEventsById.get(key);
+    if (taskEvents) {
+      taskEvents.push(parsed);
+    } else {
+      taskEventsById.set(key, [parsed]);
     }
-    taskEventsById.get(key)!.push(parsed);
   }
 
   const taskDurations: number[] = [];
@@ -124,9 +125,11 @@ export function buildCycleTimeAnalytics(input: {
   }
 
   const uniqueSpecs = new Map<string, SpecLike>();
-  for (const spec of [...input.specs, ...input.archivedSpecs]) {
-    if (!uniqueSpecs.has(spec.name)) {
-      uniqueSpecs.set(spec.name, spec);
+  for (const specs of [input.specs, input.archivedSpecs]) {
+    for (const spec of specs) {
+      if (!uniqueSpecs.has(spec.name)) {
+        uniqueSpecs.set(spec.name, spec);
+      }
     }
   }
 
@@ -176,6 +179,9 @@ export function buildCycleTimeAnalytics(input: {
     dataCoverage.push('Task transition history is empty; cycle time will populate as tasks move through statuses.');
   }
 
+  taskDurations.sort((a, b) => a - b);
+  specDurations.sort((a, b) => a - b);
+
   return {
     windowDays: window.windowDays,
     startDate: window.startDate,
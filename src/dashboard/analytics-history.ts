@@ -98,9 +98,11 @@ export function buildAnalyticsHistory(input: {
     pointsByDate.set(key, point);
   }
 
-  for (const spec of [...input.specs, ...input.archivedSpecs]) {
-    incrementPoint(pointsByDate, parseDayKey(spec.createdAt), 'specsCreated');
-    incrementPoint(pointsByDate, parseDayKey(spec.lastModified), 'specsModified');
+  for (const specs of [input.specs, input.archivedSpecs]) {
+    for (const spec of specs) {
+      incrementPoint(pointsByDate, parseDayKey(spec.createdAt), 'specsCreated');
+      incrementPoint(pointsByDate, parseDayKey(spec.lastModified), 'specsModified');
+    }
   }
 
   for (const approval of input.approvals) {
@@ -75,4 +75,54 @@ describe('analytics task events', () => {
     expect(events).toHaveLength(1);
     expect(events[0].specName).toBe('spec-a');
   });
+
+  it('separates appended events from a log missing its trailing newline', async () => {
+    const projectPath = await createTempProjectPath();
+    const filePath = getTaskEventsFilePath(projectPath);
+    await fs.mkdir(join(projectPath, '.spec-context', 'analytics'), { recursive: true });
+    await fs.writeFile(
+      filePath,
+      '{"timestamp":"2026-02-27T10:00:00Z","specName":"spec-a","taskId":"1","previousStatus":"pending","nextStatus":"in-progress","summaryAfter":{"total":1,"completed":0,"pending":0}}',
+      'utf8'
+    );
+
+    await appendTaskTransitionEvent(projectPath, {
+      timestamp: '2026-02-27T11:00:00Z',
+      specName: 'spec-a',
+      taskId: '1',
+      previousStatus: 'in-progress',
+      nextStatus: 'completed',
+      summaryAfter: {
+        total: 1,
+        completed: 1,
+        pending: 0,
+      },
+    });
+
+    const events = await readTaskTransitionEvents(projectPath);
+    expect(events).toHaveLength(2);
+    expect(events[1].nextStatus).toBe('completed');
+  });
+
+  it('keeps every event intact and in order under concurrent appends', async () => {
+    const projectPath = await createTempProjectPath();
+
+    await Promise.all(Array.from({ length: 12 }, (_, index) => appendTaskTransitionEvent(projectPath, {
+      timestamp: `2026-02-27T10:${String(index).padStart(2, '0')}:00Z`,
+      specName: 'spec-a',
+      taskId: String(index + 1),
+      previousStatus: 'pending',
+      nextStatus: 'completed',
+      summaryAfter: {
+        total: 12,
+        completed: index + 1,
+        pending: 11 - index,
+      },
+    })));
+
+    const events = await readTaskTransitionEvents(projectPath);
+    expect(events.map((event) => event.taskId)).toEqual(
+      Array.from({ length: 12 }, (_, index) => String(index + 1))
+    );
+  });
 });
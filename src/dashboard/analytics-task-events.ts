@@ -93,26 +93,84 @@ export function getTaskEventsFilePath(projectPath: string): string {
   return join(PathUtils.getWorkflowRoot(projectPath), 'analytics', 'task-events.jsonl');
 }
 
+// Only the final byte decides whether the log needs a separator, so avoid
+// reading and decoding the whole (append-only, ever-growing) file.
+async function needsLineSeparator(filePath: string): Promise<boolean> {
+  let handle: fs.FileHandle;
+  try {
+    handle = await fs.open(filePath, 'r');
+  } catch (error: unknown) {
+    if (typeof error === 'object' && error !== null && 'code' in error && (error as { code?: string }).code === 'ENOENT') {
+      return false;
+    }
+    throw error;
+  }
+
+  try {
+    const { size } = await handle.stat();
+    if (size === 0) {
+      return false;
+    }
+    const lastByte = Buffer.alloc(1);
+    await handle.read(lastByte, 0, 1, size - 1);
+    return lastByte[0] !== 0x0a;
+  } finally {
+    await handle.close();
+  }
+}
+
+async function writeTaskEventLines(filePath: string, lines: string[]): Promise<void> {
+  await fs.mkdir(dirname(filePath), { recursive: true });
+
+  const separator = (await needsLineSeparator(filePath)) ? '\n' : '';
+  await fs.appendFile(filePath, `${separator}${lines.join('\n')}\n`, 'utf8');
+}
+
+interface PendingTaskEventBatch {
+  lines: string[];
+  written: Promise<void>;
+}
+
+// Writes to one log are serialized behind a single writer. Events that arrive while a
+// write is pending join the next batch and land in one appendFile call, so concurrent
+// task updates neither race on the separator check nor pay one write each.
+const openTaskEventBatches = new Map<string, PendingTaskEventBatch>();
+const lastTaskEventWrites = new Map<string, Promise<void>>();
+
 export async function appendTaskTransitionEvent(
   projectPath: string,
   event: TaskTransitionEvent
 ): Promise<void> {
   const filePath = getTaskEventsFilePath(projectPath);
-  await fs.mkdir(dirname(filePath), { recursive: true });
+  const line = JSON.stringify(event);
 
-  let separator = '';
-  try {
-    const existing = await fs.readFile(filePath, 'utf8');
-    if (existing.length > 0 && !existing.endsWith('\n')) {
-      separator = '\n';
-    }
-  } catch (error: unknown) {
-    if (!(typeof error === 'object' && error !== null && 'code' in error && (error as { code?: string }).code === 'ENOENT')) {
-      throw error;
-    }
+  const openBatch = openTaskEventBatches.get(filePath);
+  if (openBatch) {
+    openBatch.lines.push(line);
+    return openBatch.written;
   }
 
-  await fs.appendFile(filePath, `${separator}${JSON.stringify(event)}\n`, 'utf8');
+  const batch: PendingTaskEventBatch = { lines: [line], written: Promise.resolve() };
+  const previousWrite = lastTaskEventWrites.get(filePath) ?? Promise.resolve();
+  batch.written = previousWrite
+    .catch(() => undefined)
+    .then(() => {
+      if (openTaskEventBatches.get(filePath) === batch) {
+        openTaskEventBatches.delete(filePath);
+      }
+      return writeTaskEventLines(filePath, batch.lines);
+    });
+  openTaskEventBatches.set(filePath, batch);
+  lastTaskEventWrites.set(filePath, batch.written);
+
+  const releaseWriter = () => {
+    if (lastTaskEventWrites.get(filePath) === batch.written) {
+      lastTaskEventWrites.delete(filePath);
+    }
+  };
+  batch.written.then(releaseWriter, releaseWriter);
+
+  return batch.written;
 }
 
 export async function readTaskTransitionEvents(projectPath: string): Promise<TaskTransitionEvent[]> {
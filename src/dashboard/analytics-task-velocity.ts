@@ -53,10 +53,13 @@ export function buildTaskVelocityAnalytics(input: {
     partialData = true;
     dataCoverage.push('Task transition history is empty; velocity will become accurate as new status updates are recorded.');
   } else {
-    const firstEvent = input.events
-      .map((event) => parseTimestamp(event.timestamp))
-      .filter((value): value is Date => value !== null)
-      .sort((a, b) => a.getTime() - b.getTime())[0];
+    let firstEvent: Date | null = null;
+    for (const event of input.events) {
+      const timestamp = parseTimestamp(event.timestamp);
+      if (timestamp && (!firstEvent || timestamp.getTime() < firstEvent.getTime())) {
+        firstEvent = timestamp;
+      }
+    }
 
     if (firstEvent) {
       const firstEventDay = toUtcDayKey(firstEvent);
@@ -3,7 +3,6 @@
 import dotenv from 'dotenv';
 import { dirname, resolve } from 'path';
 import { fileURLToPath } from 'url';
-import { MultiProjectDashboardServer } from './multi-server.js';
 
 // Load .env from the server's own directory, not the user's project cwd
 const __filename = fileURLToPath(import.meta.url);
@@ -81,6 +80,9 @@ async function main() {
   }
 
   try {
+    // Fastify and the full dashboard stack load only once we are actually starting,
+    // not for --help or when another dashboard is already running.
+    const { MultiProjectDashboardServer } = await import('./multi-server.js');
     const dashboardServer = new MultiProjectDashboardServer({
       autoOpen: !noOpen,
       port,
@@ -0,0 +1,175 @@
+import { afterEach, beforeEach, describe, expect, it, vi } from 'vitest';
+import type { FastifyInstance } from 'fastify';
+import { EventEmitter } from 'events';
+import { promises as fs } from 'fs';
+import { join } from 'path';
+import { tmpdir } from 'os';
+import { MultiProjectDashboardServer } from './multi-server.js';
+import type { ProjectContext, ProjectManager } from './project-manager.js';
+import { SPEC_WORKFLOW_HOME_ENV } from '../core/workflow/global-dir.js';
+
+interface FakeApproval {
+  id: string;
+  status: string;
+  response?: string;
+}
+
+interface FakeApprovalStorage extends EventEmitter {
+  approval: FakeApproval;
+  getApproval: (id: string) => Promise<FakeApproval | null>;
+  getAllPendingApprovals: () => Promise<FakeApproval[]>;
+  updateApproval: (id: string, status: string, response?: string) => Promise<void>;
+  deleteApproval: (id: string) => Promise<boolean>;
+}
+
+interface TestServerContext {
+  app: FastifyInstance;
+  approvalWaiters: Map<string, Set<() => void>>;
+}
+
+function createFakeApprovalStorage(): FakeApprovalStorage {
+  const storage = new EventEmitter() as FakeApprovalStorage;
+  storage.approval = { id: 'approval-1', status: 'pending' };
+  storage.getApproval = vi.fn(async () => ({ ...storage.approval }));
+  storage.getAllPendingApprovals = vi.fn(async () => []);
+  storage.updateApproval = vi.fn(async (id: string, status: string, response?: string) => {
+    storage.approval = { id, status, response };
+  });
+  storage.deleteApproval = vi.fn(async () => true);
+  return storage;
+}
+
+function createTestServer(storage: FakeApprovalStorage): TestServerContext {
+  const server = new MultiProjectDashboardServer();
+  const instance = server as unknown as {
+    app: FastifyInstance;
+    projectManager: ProjectManager;
+    approvalWaiters: Map<string, Set<() => void>>;
+    setupProjectManagerEvents: () => void;
+    registerApiRoutes: () => void;
+  };
+  const project = {
+    projectId: 'project-1',
+    projectPath: '/tmp/project-1',
+    autoApproveMode: false,
+    approvalStorage: storage,
+  } as unknown as ProjectContext;
+  vi.spyOn(instance.projectManager, 'getProject').mockImplementation(
+    (projectId: string) => (projectId === project.projectId ? project : undefined)
+  );
+  // Mirror ProjectManager.addProject, which re-emits storage changes with the project id.
+  storage.on('approval-change', () => {
+    instance.projectManager.emit('approval-change', { projectId: project.projectId });
+  });
+  instance.setupProjectManagerEvents();
+  instance.registerApiRoutes();
+  return { app: instance.app, approvalWaiters: instance.approvalWaiters };
+}
+
+function waitUrl(query: string): string {
+  return `/api/projects/project-1/approvals/approval-1/wait?timeout=60000${query}`;
+}
+
+describe('MultiProjectDashboardServer approval wait route', () => {
+  const originalEnv = process.env;
+  let workflowHomeDir: string;
+  const activeApps: FastifyInstance[] = [];
+
+  beforeEach(async () => {
+    process.env = { ...originalEnv };
+    workflowHomeDir = join(tmpdir(), `spec-context-approval-wait-${Date.now()}-${Math.random()}`);
+    process.env[SPEC_WORKFLOW_HOME_ENV] = workflowHomeDir;
+    await fs.mkdir(workflowHomeDir, { recursive: true });
+  });
+
+  afterEach(async () => {
+    while (activeApps.length > 0) {
+      const app = activeApps.pop();
+      if (app) {
+        await app.close();
+      }
+    }
+    process.env = originalEnv;
+    await fs.rm(workflowHomeDir, { recursive: true, force: true });
+    vi.restoreAllMocks();
+  });
+
+  it('resolves concurrent waits from one approval-change without per-request storage listeners', async () => {
+    const storage = createFakeApprovalStorage();
+    const { app, approvalWaiters } = createTestServer(storage);
+    activeApps.push(app);
+
+    const pending = [
+      app.inject({ method: 'GET', url: waitUrl('&autoDelete=false') }),
+      app.inject({ method: 'GET', url: waitUrl('&autoDelete=false') }),
+    ];
+
+    await vi.waitFor(() => {
+      expect(approvalWaiters.get('project-1')?.size).toBe(2);
+    });
+    expect(storage.listenerCount('approval-change')).toBe(1);
+
+    storage.approval = { id: 'approval-1', status: 'approved', response: 'Looks good' };
+    storage.emit('approval-change');
+
+    for (const response of await Promise.all(pending)) {
+      expect(response.statusCode).toBe(200);
+      expect(response.json()).toMatchObject({
+        resolved: true,
+        status: 'approved',
+        response: 'Looks good',
+        autoDeleted: false,
+      });
+    }
+    expect(approvalWaiters.has('project-1')).toBe(false);
+  });
+
+  it('resolves a change that lands before the waiter is registered without waiting for the poll', async () => {
+    const storage = createFakeApprovalStorage();
+    storage.getApproval = vi.fn(async () => {
+      const current = { ...storage.approval };
+      // Resolve right after the route's initial read, before it registers as a waiter.
+      storage.approval = { id: 'approval-1', status: 'rejected' };
+      return current;
+    });
+    const { app, approvalWaiters } = createTestServer(storage);
+    activeApps.push(app);
+
+    const response = await app.inject({ method: 'GET', url: waitUrl('&autoDelete=false') });
+
+    expect(response.statusCode).toBe(200);
+    expect(response.json()).toMatchObject({ resolved: true, status: 'rejected', autoDeleted: false });
+    expect(storage.deleteApproval).not.toHaveBeenCalled();
+    expect(approvalWaiters.has('project-1')).toBe(false);
+  });
+
+  it('auto-approves a pending wait as soon as auto-approve is switched on', async () => {
+    const storage = createFakeApprovalStorage();
+    const { app, approvalWaiters } = createTestServer(storage);
+    activeApps.push(app);
+
+    const pending = app.inject({ method: 'GET', url: waitUrl('') });
+    await vi.waitFor(() => {
+      expect(approvalWaiters.get('project-1')?.size).toBe(1);
+    });
+
+    const toggledAt = Date.now();
+    const toggle = await app.inject({
+      method: 'PUT',
+      url: '/api/projects/project-1/approvals/auto-approve',
+      payload: { enabled: true },
+    });
+    expect(toggle.statusCode).toBe(200);
+
+    const response = await pending;
+    // Well under the 5s fallback poll: the toggle itself wakes the waiter.
+    expect(Date.now() - toggledAt).toBeLessThan(1000);
+    expect(response.json()).toMatchObject({
+      resolved: true,
+      status: 'approved',
+      response: 'Auto-approved by dashboard auto-approve mode',
+      autoDeleted: true,
+    });
+    expect(storage.deleteApproval).toHaveBeenCalledWith('approval-1');
+  });
+});
@@ -7,10 +7,10 @@ import { readFile } from 'fs/promises';
 import { promises as fs } from 'fs';
 import { fileURLToPath } from 'url';
 import { createHash, randomUUID } from 'crypto';
-import open from 'open';
 import { WebSocket } from 'ws';
+import { setBoundedMapEntry } from '../core/cache/bounded-map.js';
 import { validateAndCheckPort, DASHBOARD_HEALTH_MESSAGE } from './utils.js';
-import { parseTasksFromMarkdown } from '../core/workflow/task-parser.js';
+import { parseTasksFromMarkdown, updateTaskStatus } from '../core/workflow/task-parser.js';
 import type { ProjectManager } from './project-manager.js';
 import { createNodeProjectManager } from './project-manager-node.js';
 import { JobScheduler } from './job-scheduler.js';
@@ -60,9 +60,78 @@ function isNotFoundError(error: unknown): boolean {
     && (error as { code?: unknown }).code === 'ENOENT';
 }
 
+async function readOptionalFile(filePath: string): Promise<string | undefined> {
+  try {
+    return await readFile(filePath, 'utf-8');
+  } catch (error) {
+    if (isNotFoundError(error)) {
+      return undefined;
+    }
+    throw error;
+  }
+}
+
+const PACKAGED_CHANGELOG_PATH = join(__dirname, '..', '..', 'CHANGELOG.md');
+let packagedChangelogContent: Promise<string> | null = null;
+
+// CHANGELOG.md ships with the package and does not change while the server runs.
+function readPackagedChangelog(): Promise<string> {
+  if (!packagedChangelogContent) {
+    packagedChangelogContent = readFile(PACKAGED_CHANGELOG_PATH, 'utf-8').catch((error: unknown) => {
+      packagedChangelogContent = null;
+      throw error;
+    });
+  }
+  return packagedChangelogContent;
+}
+
+const MAX_CHANGELOG_SECTION_CACHE_ENTRIES = 32;
+const changelogSections = new Map<string, string | null>();
+
+// Sections are cut from the memoized changelog, so memoize them per version too.
+async function readChangelogSection(version: string): Promise<string | null> {
+  const cached = changelogSections.get(version);
+  if (cached !== undefined) {
+    return cached;
+  }
+
+  const content = await readPackagedChangelog();
+  const versionRegex = new RegExp(`## \\[${version}\\][^]*?(?=## \\[|$)`, 'i');
+  const match = content.match(versionRegex);
+  const section = match ? match[0].trim() : null;
+  setBoundedMapEntry(changelogSections, version, section, MAX_CHANGELOG_SECTION_CACHE_ENTRIES);
+  return section;
+}
+
+const APPROVAL_WAIT_FALLBACK_POLL_MS = 5000;
+
+// Per API key and opt-in: unset or 0 leaves AI review requests unthrottled.
+function resolveAiReviewMaxRequestsPerSecond(): number | undefined {
+  const raw = process.env.SPEC_CONTEXT_AI_REVIEW_MAX_RPS?.trim();
+  if (!raw) {
+    return undefined;
+  }
+  const parsed = Number(raw);
+  if (!Number.isFinite(parsed) || parsed < 0) {
+    console.warn(`[dashboard] Ignoring invalid SPEC_CONTEXT_AI_REVIEW_MAX_RPS="${raw}"; AI review requests are not throttled`);
+    return undefined;
+  }
+  return parsed > 0 ? parsed : undefined;
+}
+
 const VALID_DISCIPLINES = ['full', 'standard', 'minimal'] as const;
 const VALID_DISCIPLINE_SET = new Set<string>(VALID_DISCIPLINES);
 const KNOWN_AGENT_SET = new Set<string>(KNOWN_AGENTS.map(agent => agent.trim().toLowerCase()));
+const TRUTHY_ENV_VALUES = new Set<string>(['1', 'true', 'yes']);
+// Fixed route-parameter vocabularies, built once instead of per request.
+const EDITABLE_SPEC_DOCUMENTS = new Set<string>(['requirements', 'design', 'tasks']);
+const APPROVAL_ACTION_STATUS = new Map<string, 'approved' | 'rejected' | 'needs-revision'>([
+  ['approve', 'approved'],
+  ['reject', 'rejected'],
+  ['needs-revision', 'needs-revision'],
+]);
+const TASK_STATUS_UPDATE_VALUES = new Set<string>(['pending', 'in-progress', 'completed']);
+const AI_REVIEW_MODEL_SET = new Set<string>(Object.keys(AI_REVIEW_MODELS));
 const RUNTIME_SETTINGS_KEYS = [
   'discipline',
   'implementer',
@@ -85,11 +154,11 @@ function sanitizeRuntimeSettingsUpdatePayload(
   const updates: Record<string, unknown> = {};
 
   for (const key of RUNTIME_SETTINGS_KEYS) {
-    if (!(key in payload)) {
+    // One property read per key; JSON bodies cannot carry undefined, so it means "absent".
+    const value = payload[key];
+    if (value === undefined) {
       continue;
     }
-
-    const value = payload[key];
     if (value === null) {
       updates[key] = null;
       continue;
@@ -145,6 +214,9 @@ export class MultiProjectDashboardServer {
   private readonly HEARTBEAT_TIMEOUT_MS = 10000;
   // Debounce spec broadcasts to coalesce rapid updates
   private pendingSpecBroadcasts: Map<string, NodeJS.Timeout> = new Map();
+  // Long-poll approval waiters per project, woken from the single project manager
+  // approval-change listener rather than one storage listener per request.
+  private approvalWaiters: Map<string, Set<() => void>> = new Map();
   private readonly SPEC_BROADCAST_DEBOUNCE_MS = 300;
   private readonly aiReviewServicesByApiKeyHash = new Map<string, { service: AiReviewService; lastAccessAt: number }>();
   private readonly aiReviewServiceCacheSalt = randomUUID();
@@ -197,8 +269,8 @@ export class MultiProjectDashboardServer {
     console.error('');
 
     // Fetch package version once at startup (can be disabled via env)
-    const disableVersionCheck = ['1', 'true', 'yes']
-      .includes((process.env.SPEC_CONTEXT_DISABLE_VERSION_CHECK || '').trim().toLowerCase());
+    const disableVersionCheck = TRUTHY_ENV_VALUES
+      .has((process.env.SPEC_CONTEXT_DISABLE_VERSION_CHECK || '').trim().toLowerCase());
     const loadLocalVersion = async (): Promise<string | null> => {
       try {
         const packageJsonPath = join(__dirname, '..', '..', 'package.json');
@@ -401,6 +473,7 @@ export class MultiProjectDashboardServer {
 
     // Open browser if requested
     if (this.options.autoOpen) {
+      const { default: open } = await import('open');
       await open(dashboardUrl);
     }
 
@@ -421,6 +494,7 @@ export class MultiProjectDashboardServer {
         apiKey,
         timeout: 60000,
         telemetryMeter,
+        maxRequestsPerSecond: resolveAiReviewMaxRequestsPerSecond(),
       }),
       budgetGuard: new BudgetGuard(),
       telemetryMeter,
@@ -558,8 +632,9 @@ export class MultiProjectDashboardServer {
       }
     });
 
-    // Broadcast approval changes
+    // Wake approval long-polls, then broadcast approval changes
     this.projectManager.on('approval-change', async (event) => {
+      this.notifyApprovalWaiters(event.projectId);
       try {
         const { projectId } = event;
         const project = this.projectManager.getProject(projectId);
@@ -578,6 +653,31 @@ export class MultiProjectDashboardServer {
     });
   }
 
+  private addApprovalWaiter(projectId: string, waiter: () => void): () => void {
+    let waiters = this.approvalWaiters.get(projectId);
+    if (!waiters) {
+      waiters = new Set();
+      this.approvalWaiters.set(projectId, waiters);
+    }
+    waiters.add(waiter);
+    return () => {
+      const current = this.approvalWaiters.get(projectId);
+      if (!current) return;
+      current.delete(waiter);
+      if (current.size === 0) {
+        this.approvalWaiters.delete(projectId);
+      }
+    };
+  }
+
+  private notifyApprovalWaiters(projectId: string): void {
+    const waiters = this.approvalWaiters.get(projectId);
+    if (!waiters) return;
+    for (const waiter of Array.from(waiters)) {
+      waiter();
+    }
+  }
+
   private registerApiRoutes() {
     // Health check endpoint (used by utils.ts to detect running dashboard)
     this.app.get('/health', async () => {
@@ -882,8 +982,7 @@ export class MultiProjectDashboardServer {
         return reply.code(404).send({ error: 'Project not found' });
       }
 
-      const allowedDocs = ['requirements', 'design', 'tasks'];
-      if (!allowedDocs.includes(document)) {
+      if (!EDITABLE_SPEC_DOCUMENTS.has(document)) {
         return reply.code(400).send({ error: 'Invalid document type' });
       }
 
@@ -972,6 +1071,8 @@ export class MultiProjectDashboardServer {
       }
 
       project.autoApproveMode = enabled;
+      // Waiters auto-approve on their next check, so run it now instead of on the fallback poll.
+      this.notifyApprovalWaiters(projectId);
 
       // If enabling, immediately resolve any currently pending approvals to unblock wait-for-approval calls.
       let autoApprovedCount = 0;
@@ -1061,19 +1162,12 @@ export class MultiProjectDashboardServer {
         return reply.code(404).send({ error: 'Project not found' });
       }
 
-      const validActions = ['approve', 'reject', 'needs-revision'];
-      if (!validActions.includes(action)) {
+      // Validate the action and convert it to a status value in one lookup
+      const status = APPROVAL_ACTION_STATUS.get(action);
+      if (!status) {
         return reply.code(400).send({ error: 'Invalid action' });
       }
 
-      // Convert action name to status value
-      const actionToStatus: Record<string, 'approved' | 'rejected' | 'needs-revision'> = {
-        'approve': 'approved',
-        'reject': 'rejected',
-        'needs-revision': 'needs-revision'
-      };
-      const status = actionToStatus[action];
-
       try {
         await project.approvalStorage.updateApproval(id, status, response, annotations, comments);
         return { success: true };
@@ -1149,9 +1243,16 @@ export class MultiProjectDashboardServer {
         let timeoutHandle: NodeJS.Timeout;
         let checkInterval: NodeJS.Timeout;
 
+        let checkInFlight: Promise<void> | null = null;
+        let recheckRequested = false;
+
+        let removeWaiter: (() => void) | undefined;
+
         const cleanup = () => {
           if (timeoutHandle) clearTimeout(timeoutHandle);
           if (checkInterval) clearInterval(checkInterval);
+          removeWaiter?.();
+          removeWaiter = undefined;
         };
 
         const checkAndRespond = async () => {
@@ -1214,8 +1315,30 @@ export class MultiProjectDashboardServer {
           }
         };
 
-        // Poll every 500ms for changes (file watcher triggers approval-change event)
-        checkInterval = setInterval(checkAndRespond, 500);
+        // Run one check at a time; changes that land mid-check trigger exactly one follow-up.
+        const scheduleCheck = () => {
+          if (resolved) return;
+          if (checkInFlight) {
+            recheckRequested = true;
+            return;
+          }
+          checkInFlight = checkAndRespond().finally(() => {
+            checkInFlight = null;
+            if (recheckRequested) {
+              recheckRequested = false;
+              scheduleCheck();
+            }
+          });
+        };
+
+        // The approvals watcher emits approval-change on every file update, and toggling
+        // auto-approve notifies waiters too, so wake on those instead of re-reading the
+        // approval twice a second. The slow interval only covers missed watcher events.
+        removeWaiter = this.addApprovalWaiter(projectId, scheduleCheck);
+        checkInterval = setInterval(scheduleCheck, APPROVAL_WAIT_FALLBACK_POLL_MS);
+        // A change that landed between the initial read above and subscribing emitted no
+        // event this waiter could see, so check once right away.
+        scheduleCheck();
 
         // Timeout handler
         timeoutHandle = setTimeout(() => {
@@ -1343,8 +1466,7 @@ export class MultiProjectDashboardServer {
       }
 
       // Validate model parameter
-      const validModels = Object.keys(AI_REVIEW_MODELS);
-      const selectedModel: AiReviewModel = validModels.includes(model || '')
+      const selectedModel: AiReviewModel = AI_REVIEW_MODEL_SET.has(model || '')
         ? (model as AiReviewModel)
         : 'deepseek-v3';
 
@@ -1392,65 +1514,28 @@ export class MultiProjectDashboardServer {
           });
         }
 
-        // Load steering docs for context (if they exist)
-        const steeringDocs: SteeringContext = {};
+        // Load steering docs and previous spec documents for context (if they exist).
+        // If reviewing design.md, load requirements.md; if reviewing tasks.md, load
+        // requirements.md and design.md. The reads are independent, so issue them together.
         const steeringPath = join(project.projectPath, '.spec-context', 'steering');
-        try {
-          steeringDocs.product = await readFile(join(steeringPath, 'product.md'), 'utf-8');
-        } catch (error) {
-          if (!isNotFoundError(error)) {
-            throw error;
-          }
-        }
-        try {
-          steeringDocs.tech = await readFile(join(steeringPath, 'tech.md'), 'utf-8');
-        } catch (error) {
-          if (!isNotFoundError(error)) {
-            throw error;
-          }
-        }
-        try {
-          steeringDocs.structure = await readFile(join(steeringPath, 'structure.md'), 'utf-8');
-        } catch (error) {
-          if (!isNotFoundError(error)) {
-            throw error;
-          }
-        }
-        try {
-          steeringDocs.principles = await readFile(join(steeringPath, 'principles.md'), 'utf-8');
-        } catch (error) {
-          if (!isNotFoundError(error)) {
-            throw error;
-          }
-        }
-
-        // Load previous spec documents for context (if reviewing design or tasks)
-        const specDocsContext: SpecDocsContext = {};
-        if (approval.category === 'spec' && approval.categoryName) {
-          const specPath = join(project.projectPath, '.spec-context', 'specs', approval.categoryName);
-          const filePath = approval.filePath.toLowerCase();
-
-          // If reviewing design.md, load requirements.md
-          // If reviewing tasks.md, load requirements.md and design.md
-          if (filePath.includes('design.md') || filePath.includes('tasks.md')) {
-            try {
-              specDocsContext.requirements = await readFile(join(specPath, 'requirements.md'), 'utf-8');
-            } catch (error) {
-              if (!isNotFoundError(error)) {
-                throw error;
-              }
-            }
-          }
-          if (filePath.includes('tasks.md')) {
-            try {
-              specDocsContext.design = await readFile(join(specPath, 'design.md'), 'utf-8');
-            } catch (error) {
-              if (!isNotFoundError(error)) {
-                throw error;
-              }
-            }
-          }
-        }
+        const reviewedFilePath = approval.filePath.toLowerCase();
+        const specPath = approval.category === 'spec' && approval.categoryName
+          ? join(project.projectPath, '.spec-context', 'specs', approval.categoryName)
+          : null;
+        const loadRequirements = specPath !== null
+          && (reviewedFilePath.includes('design.md') || reviewedFilePath.includes('tasks.md'));
+        const loadDesign = specPath !== null && reviewedFilePath.includes('tasks.md');
+
+        const [product, tech, structure, principles, requirements, design] = await Promise.all([
+          readOptionalFile(join(steeringPath, 'product.md')),
+          readOptionalFile(join(steeringPath, 'tech.md')),
+          readOptionalFile(join(steeringPath, 'structure.md')),
+          readOptionalFile(join(steeringPath, 'principles.md')),
+          loadRequirements ? readOptionalFile(join(specPath, 'requirements.md')) : undefined,
+          loadDesign ? readOptionalFile(join(specPath, 'design.md')) : undefined,
+        ]);
+        const steeringDocs: SteeringContext = { product, tech, structure, principles };
+        const specDocsContext: SpecDocsContext = { requirements, design };
 
         // Call AI review service with shared runtime event/snapshot state
         const reviewService = this.getAiReviewService(apiKey);
@@ -1615,7 +1700,7 @@ export class MultiProjectDashboardServer {
         return reply.code(404).send({ error: 'Project not found' });
       }
 
-      if (!status || !['pending', 'in-progress', 'completed'].includes(status)) {
+      if (!status || !TASK_STATUS_UPDATE_VALUES.has(status)) {
         return reply.code(400).send({ error: 'Invalid status. Must be pending, in-progress, or completed' });
       }
 
@@ -1647,7 +1732,6 @@ export class MultiProjectDashboardServer {
           };
         }
 
-        const { updateTaskStatus } = await import('../core/workflow/task-parser.js');
         const updatedContent = updateTaskStatus(tasksContent, taskId, status);
 
         if (updatedContent === tasksContent) {
@@ -1692,18 +1776,12 @@ export class MultiProjectDashboardServer {
       const { version } = request.params as { version: string };
 
       try {
-        const changelogPath = join(__dirname, '..', '..', 'CHANGELOG.md');
-        const content = await readFile(changelogPath, 'utf-8');
-
-        // Extract the section for the requested version
-        const versionRegex = new RegExp(`## \\[${version}\\][^]*?(?=## \\[|$)`, 'i');
-        const match = content.match(versionRegex);
-
-        if (!match) {
+        const section = await readChangelogSection(version);
+        if (section === null) {
           return reply.code(404).send({ error: `Changelog for version ${version} not found` });
         }
 
-        return { content: match[0].trim() };
+        return { content: section };
       } catch (error: any) {
         if (error.code === 'ENOENT') {
           return reply.code(404).send({ error: 'Changelog file not found' });
@@ -1717,18 +1795,12 @@ export class MultiProjectDashboardServer {
       const { version } = request.params as { version: string };
 
       try {
-        const changelogPath = join(__dirname, '..', '..', 'CHANGELOG.md');
-        const content = await readFile(changelogPath, 'utf-8');
-
-        // Extract the section for the requested version
-        const versionRegex = new RegExp(`## \\[${version}\\][^]*?(?=## \\[|$)`, 'i');
-        const match = content.match(versionRegex);
-
-        if (!match) {
+        const section = await readChangelogSection(version);
+        if (section === null) {
           return reply.code(404).send({ error: `Changelog for version ${version} not found` });
         }
 
-        return { content: match[0].trim() };
+        return { content: section };
       } catch (error: any) {
         if (error.code === 'ENOENT') {
           return reply.code(404).send({ error: 'Changelog file not found' });
@@ -1790,7 +1862,7 @@ export class MultiProjectDashboardServer {
     // Get a specific automation job
     this.app.get('/api/jobs/:jobId', async (request, reply) => {
       const { jobId } = request.params as { jobId: string };
-      const settingsManager = new (await import('./settings-manager.js')).SettingsManager();
+      const settingsManager = new SettingsManager();
 
       try {
         const job = await settingsManager.getJob(jobId);
@@ -1996,10 +2068,10 @@ export class MultiProjectDashboardServer {
     // Stop project manager
     await this.projectManager.stop();
 
-    // Flush runtime telemetry/state before shutdown
-    for (const { service } of this.aiReviewServicesByApiKeyHash.values()) {
-      await service.flushRuntimeState();
-    }
+    // Flush runtime telemetry/state before shutdown; each service persists independently
+    await Promise.all(
+      Array.from(this.aiReviewServicesByApiKeyHash.values(), ({ service }) => service.flushRuntimeState())
+    );
 
     // Close the Fastify server
     await this.app.close();
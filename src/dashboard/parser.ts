@@ -40,18 +40,12 @@ export class SpecParser implements ISpecParser {
 
   async getAllSpecs(): Promise<ParsedSpec[]> {
     try {
-      await access(this.specsPath);
       const entries = await readdir(this.specsPath, { withFileTypes: true });
       const specDirs = entries.filter(entry => entry.isDirectory());
       
-      const specs: ParsedSpec[] = [];
-      for (const dir of specDirs) {
-        const spec = await this.getSpec(dir.name);
-        if (spec) {
-          specs.push(spec);
-        }
-      }
-      
+      const loaded = await Promise.all(specDirs.map(dir => this.getSpec(dir.name)));
+      const specs = loaded.filter((spec): spec is ParsedSpec => spec !== null);
+
       return specs.sort((a, b) => a.name.localeCompare(b.name));
     } catch (error) {
       if (isNotFoundError(error)) {
@@ -63,18 +57,12 @@ export class SpecParser implements ISpecParser {
 
   async getAllArchivedSpecs(): Promise<ParsedSpec[]> {
     try {
-      await access(this.archiveSpecsPath);
       const entries = await readdir(this.archiveSpecsPath, { withFileTypes: true });
       const specDirs = entries.filter(entry => entry.isDirectory());
       
-      const specs: ParsedSpec[] = [];
-      for (const dir of specDirs) {
-        const spec = await this.getArchivedSpec(dir.name);
-        if (spec) {
-          specs.push(spec);
-        }
-      }
-      
+      const loaded = await Promise.all(specDirs.map(dir => this.getArchivedSpec(dir.name)));
+      const specs = loaded.filter((spec): spec is ParsedSpec => spec !== null);
+
       return specs.sort((a, b) => a.name.localeCompare(b.name));
     } catch (error) {
       if (isNotFoundError(error)) {
@@ -85,107 +73,64 @@ export class SpecParser implements ISpecParser {
   }
 
   async getSpec(name: string): Promise<ParsedSpec | null> {
-    try {
-      const specDir = PathUtils.getSpecPath(this.projectPath, name);
-      await access(specDir);
-
-      const spec: ParsedSpec = {
-        name,
-        displayName: this.formatDisplayName(name),
-        createdAt: '',
-        lastModified: '',
-        phases: {
-          requirements: { exists: false },
-          design: { exists: false },
-          tasks: { exists: false },
-          implementation: { exists: false }
-        }
-      };
+    return this.parseSpecDir(name, PathUtils.getSpecPath(this.projectPath, name));
+  }
 
-      // Get directory stats
-      const dirStats = await stat(specDir);
-      spec.createdAt = dirStats.birthtime.toISOString();
-      spec.lastModified = dirStats.mtime.toISOString();
+  async getArchivedSpec(name: string): Promise<ParsedSpec | null> {
+    return this.parseSpecDir(name, PathUtils.getArchiveSpecPath(this.projectPath, name));
+  }
 
-      // Check each phase
-      const requirementsPath = join(specDir, 'requirements.md');
-      const designPath = join(specDir, 'design.md');
-      const tasksPath = join(specDir, 'tasks.md');
 
-      // Check requirements
-      try {
-        await access(requirementsPath);
-        spec.phases.requirements.exists = true;
-        const reqStats = await stat(requirementsPath);
-        spec.phases.requirements.lastModified = reqStats.mtime.toISOString();
-        
-        // Update overall last modified if this is newer
-        if (reqStats.mtime > new Date(spec.lastModified)) {
-          spec.lastModified = reqStats.mtime.toISOString();
-        }
-      } catch (error) {
-        if (!isNotFoundError(error)) {
-          throw error;
-        }
-      }
-
-      // Check design
-      try {
-        await access(designPath);
-        spec.phases.design.exists = true;
-        const designStats = await stat(designPath);
-        spec.phases.design.lastModified = designStats.mtime.toISOString();
-        
-        if (designStats.mtime > new Date(spec.lastModified)) {
-          spec.lastModified = designStats.mtime.toISOString();
-        }
-      } catch (error) {
-        if (!isNotFoundError(error)) {
-          throw error;
-        }
+  async getProjectSteeringStatus(): Promise<SteeringStatus> {
+    const status: SteeringStatus = {
+      exists: false,
+      documents: {
+        product: false,
+        tech: false,
+        structure: false,
+        principles: false,
       }
+    };
 
-      // Check tasks
-      try {
-        await access(tasksPath);
-        spec.phases.tasks.exists = true;
-        const tasksStats = await stat(tasksPath);
-        spec.phases.tasks.lastModified = tasksStats.mtime.toISOString();
-        
-        if (tasksStats.mtime > new Date(spec.lastModified)) {
-          spec.lastModified = tasksStats.mtime.toISOString();
-        }
+    try {
+      const steeringStats = await stat(this.steeringPath);
+      status.exists = true;
+      status.lastModified = steeringStats.mtime.toISOString();
 
-        // Parse tasks to get progress
-        const tasksContent = await readFile(tasksPath, 'utf-8');
-        const taskProgress = parseTaskProgress(tasksContent);
-        spec.taskProgress = {
-          total: taskProgress.total,
-          completed: taskProgress.completed,
-          pending: taskProgress.pending
-        };
-      } catch (error) {
-        if (!isNotFoundError(error)) {
-          throw error;
-        }
+      // Check each steering document
+      const [product, tech, structure, principles] = await Promise.all([
+        this.steeringDocumentExists('product.md'),
+        this.steeringDocumentExists('tech.md'),
+        this.steeringDocumentExists('structure.md'),
+        this.steeringDocumentExists('principles.md'),
+      ]);
+      status.documents = { product, tech, structure, principles };
+    } catch (error) {
+      if (!isNotFoundError(error)) {
+        throw error;
       }
+    }
 
-      // Implementation phase is always considered "exists" since it's ongoing manual work
-      spec.phases.implementation.exists = true;
+    return status;
+  }
 
-      return spec;
+  private async steeringDocumentExists(fileName: string): Promise<boolean> {
+    try {
+      await access(join(this.steeringPath, fileName));
+      return true;
     } catch (error) {
       if (isNotFoundError(error)) {
-        return null;
+        return false;
       }
       throw error;
     }
   }
 
-  async getArchivedSpec(name: string): Promise<ParsedSpec | null> {
+  // Active and archived specs share the same on-disk layout; only the directory differs.
+  private async parseSpecDir(name: string, specDir: string): Promise<ParsedSpec | null> {
     try {
-      const specDir = PathUtils.getArchiveSpecPath(this.projectPath, name);
-      await access(specDir);
+      // stat() doubles as the existence check (ENOENT -> null)
+      const dirStats = await stat(specDir);
 
       const spec: ParsedSpec = {
         name,
@@ -200,8 +145,6 @@ export class SpecParser implements ISpecParser {
         }
       };
 
-      // Get directory stats
-      const dirStats = await stat(specDir);
       spec.createdAt = dirStats.birthtime.toISOString();
       spec.lastModified = dirStats.mtime.toISOString();
 
@@ -212,9 +155,8 @@ export class SpecParser implements ISpecParser {
 
       // Check requirements
       try {
-        await access(requirementsPath);
-        spec.phases.requirements.exists = true;
         const reqStats = await stat(requirementsPath);
+        spec.phases.requirements.exists = true;
         spec.phases.requirements.lastModified = reqStats.mtime.toISOString();
         
         // Update overall last modified if this is newer
@@ -229,9 +171,8 @@ export class SpecParser implements ISpecParser {
 
       // Check design
       try {
-        await access(designPath);
-        spec.phases.design.exists = true;
         const designStats = await stat(designPath);
+        spec.phases.design.exists = true;
         spec.phases.design.lastModified = designStats.mtime.toISOString();
         
         if (designStats.mtime > new Date(spec.lastModified)) {
@@ -245,9 +186,8 @@ export class SpecParser implements ISpecParser {
 
       // Check tasks
       try {
-        await access(tasksPath);
-        spec.phases.tasks.exists = true;
         const tasksStats = await stat(tasksPath);
+        spec.phases.tasks.exists = true;
         spec.phases.tasks.lastModified = tasksStats.mtime.toISOString();
         
         if (tasksStats.mtime > new Date(spec.lastModified)) {
@@ -280,73 +220,6 @@ export class SpecParser implements ISpecParser {
     }
   }
 
-
-  async getProjectSteeringStatus(): Promise<SteeringStatus> {
-    const status: SteeringStatus = {
-      exists: false,
-      documents: {
-        product: false,
-        tech: false,
-        structure: false,
-        principles: false,
-      }
-    };
-
-    try {
-      await access(this.steeringPath);
-      status.exists = true;
-
-      // Check each steering document
-      try {
-        await access(join(this.steeringPath, 'product.md'));
-        status.documents.product = true;
-      } catch (error) {
-        if (!isNotFoundError(error)) {
-          throw error;
-        }
-      }
-
-      try {
-        await access(join(this.steeringPath, 'tech.md'));
-        status.documents.tech = true;
-      } catch (error) {
-        if (!isNotFoundError(error)) {
-          throw error;
-        }
-      }
-
-      try {
-        await access(join(this.steeringPath, 'structure.md'));
-        status.documents.structure = true;
-      } catch (error) {
-        if (!isNotFoundError(error)) {
-          throw error;
-        }
-      }
-
-      try {
-        await access(join(this.steeringPath, 'principles.md'));
-        status.documents.principles = true;
-      } catch (error) {
-        if (!isNotFoundError(error)) {
-          throw error;
-        }
-      }
-
-      // Get last modified time for steering directory
-      const steeringStats = await stat(this.steeringPath);
-      status.lastModified = steeringStats.mtime.toISOString();
-
-    } catch (error) {
-      if (!isNotFoundError(error)) {
-        throw error;
-      }
-    }
-
-    return status;
-  }
-
-
   private formatDisplayName(kebabCase: string): string {
     return kebabCase
       .split('-')
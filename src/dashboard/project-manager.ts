@@ -279,10 +279,8 @@ export class ProjectManager extends EventEmitter {
       this.registryWatcher = undefined;
     }
 
-    const projectIds = Array.from(this.projects.keys());
-    for (const projectId of projectIds) {
-      await this.removeProject(projectId);
-    }
+    // Each project owns its own watcher and approval storage, so they can shut down together.
+    await Promise.all(Array.from(this.projects.keys(), projectId => this.removeProject(projectId)));
 
     this.removeAllListeners();
   }
@@ -2,22 +2,26 @@ import { describe, expect, it } from 'vitest';
 import type { ChatMessage, ChatOptions, ChatProvider, ChatResponse } from '../../core/llm/index.js';
 import { AiReviewService } from './ai-review-service.js';
 
+const DEFAULT_REPLY = JSON.stringify({
+    suggestions: [
+        {
+            comment: 'Looks good',
+        },
+    ],
+});
+
 class MockChatProvider implements ChatProvider {
     public calls: Array<{ messages: ChatMessage[]; options?: ChatOptions }> = [];
 
+    constructor(private readonly reply: string = DEFAULT_REPLY) {}
+
     async chat(messages: ChatMessage[], options?: ChatOptions): Promise<ChatResponse> {
         this.calls.push({
             messages: messages.map(message => ({ ...message })),
             options: options ? { ...options } : undefined,
         });
         return {
-            content: JSON.stringify({
-                suggestions: [
-                    {
-                        comment: 'Looks good',
-                    },
-                ],
-            }),
+            content: this.reply,
             model: options?.model ?? 'mock-model',
             usage: {
                 promptTokens: 100,
@@ -85,4 +89,18 @@ describe('AiReviewService', () => {
             service.reviewDocument('# Document\nSome content')
         ).rejects.toThrow(/429_budget_exceeded/i);
     });
+
+    it('accepts fenced JSON replies without a schema retry', async () => {
+        const chatProvider = new MockChatProvider(`\`\`\`json\n${DEFAULT_REPLY}\n\`\`\``);
+        const service = new AiReviewService('test-key', {
+            chatProvider,
+        });
+
+        const result = await service.reviewDocument('# Document\nSome content');
+
+        expect(result.suggestions).toEqual([{ quote: undefined, comment: 'Looks good' }]);
+        expect(chatProvider.calls).toHaveLength(1);
+
+        await service.flushRuntimeState();
+    });
 });
@@ -189,6 +189,28 @@ const DEFAULT_BUDGET_POLICY: BudgetPolicy = {
     retryAfterSeconds: 3600,
 };
 
+// Both derive only from module constants, so compute them once rather than per review.
+const AI_REVIEW_BUDGET_CANDIDATES: BudgetCandidate[] = Object.entries(AI_REVIEW_MODELS).map(([key, config]) => ({
+    id: key,
+    model: config.model,
+    estimatedInputCostUsdPer1k: config.estimatedInputCostUsdPer1k,
+    estimatedOutputCostUsdPer1k: config.estimatedOutputCostUsdPer1k,
+    tags: config.tags,
+}));
+
+const STABLE_PROMPT_PREFIX_HASH = createHash('sha256')
+    .update(`${REVIEW_SYSTEM_PROMPT}\n${REVIEW_USER_PREFIX}\n${REVIEW_USER_SUFFIX}`)
+    .digest('hex');
+
+// Some providers wrap JSON-mode replies in a markdown fence; unwrapping it locally
+// saves a schema-retry round trip to the model.
+const FENCED_JSON_PATTERN = /^\s*```(?:json)?[ \t]*\r?\n([\s\S]*?)\r?\n[ \t]*```\s*$/i;
+
+function unwrapFencedJson(content: string): string {
+    const match = FENCED_JSON_PATTERN.exec(content);
+    return match ? match[1] : content;
+}
+
 function isRecord(value: unknown): value is Record<string, unknown> {
     return typeof value === 'object' && value !== null;
 }
@@ -276,7 +298,7 @@ ${context.contextText}
 ${REVIEW_USER_SUFFIX}`;
 
         const estimatedInputTokens = this.estimateTokens(REVIEW_SYSTEM_PROMPT.length + userPrompt.length);
-        const candidates = this.buildBudgetCandidates();
+        const candidates = AI_REVIEW_BUDGET_CANDIDATES;
         const budgetResult = this.budgetGuard.filterCandidates(
             { estimatedInputTokens, estimatedOutputTokens: maxOutputTokens, interactive },
             candidates,
@@ -335,7 +357,7 @@ ${REVIEW_USER_SUFFIX}`;
                     },
                     {
                         k: 'prompt_stable_prefix_hash',
-                        v: this.getStablePromptPrefixHash(),
+                        v: STABLE_PROMPT_PREFIX_HASH,
                         confidence: 1,
                     },
                 ]
@@ -374,6 +396,17 @@ ${REVIEW_USER_SUFFIX}`;
         modelConfig: AiReviewModelConfig;
     }): Promise<{ response: ChatResponse; suggestions: AiSuggestion[] }> {
         let previousAssistantContent: string | null = null;
+        // Identical for every attempt, so build them once rather than per retry.
+        const runtime: ChatOptions['runtime'] = {
+            interceptors: this.interceptors,
+            historyReducer: {
+                enabled: true,
+                maxInputChars: args.maxInputChars,
+                preserveRecentRawTurns: 4,
+                summaryMaxChars: 1200,
+            },
+        };
+        const providerOptions = this.buildProviderOptions(args.modelConfig);
 
         for (let attempt = 1; attempt <= MAX_SCHEMA_RETRIES; attempt += 1) {
             const attemptMessages: ChatMessage[] = [...args.baseMessages];
@@ -395,56 +428,43 @@ ${REVIEW_USER_SUFFIX}`;
                     idempotencyKey: `${args.runId}:review:${attempt}`,
                     agentId: 'ai_review_service',
                 },
-                runtime: {
-                    interceptors: this.interceptors,
-                    historyReducer: {
-                        enabled: true,
-                        maxInputChars: args.maxInputChars,
-                        preserveRecentRawTurns: 4,
-                        summaryMaxChars: 1200,
-                    },
-                },
-                providerOptions: this.buildProviderOptions(args.modelConfig),
+                runtime,
+                providerOptions,
             });
 
-            try {
-                return {
-                    response,
-                    suggestions: this.parseResponseStrict(response.content),
-                };
-            } catch (error) {
-                previousAssistantContent = response.content;
-                if (attempt >= MAX_SCHEMA_RETRIES) {
-                    throw new Error(`schema_validation_failed: ${String(error)}`);
-                }
+            const parsed = this.parseResponseStrict(response.content);
+            if ('suggestions' in parsed) {
+                return { response, suggestions: parsed.suggestions };
+            }
+            // Schema failures are expected and retried, so only the terminal one pays for an Error.
+            previousAssistantContent = response.content;
+            if (attempt >= MAX_SCHEMA_RETRIES) {
+                throw new Error(`schema_validation_failed: ${parsed.failure}`);
             }
         }
 
         throw new Error('schema_validation_failed');
     }
 
-    private parseResponseStrict(content: string): AiSuggestion[] {
+    private parseResponseStrict(content: string): { suggestions: AiSuggestion[] } | { failure: string } {
         let parsed: unknown;
         try {
-            parsed = JSON.parse(content);
+            parsed = JSON.parse(unwrapFencedJson(content));
         } catch (error) {
-            const parseError = new Error(`schema_validation_failed: invalid_json: ${String(error)}`) as Error & { code?: string };
-            parseError.code = 'schema_validation_failed';
-            throw parseError;
+            return { failure: `invalid_json: ${String(error)}` };
         }
 
         if (!isAiReviewResponsePayload(parsed)) {
-            const schemaError = new Error('schema_validation_failed: invalid_schema') as Error & { code?: string };
-            schemaError.code = 'schema_validation_failed';
-            throw schemaError;
+            return { failure: 'invalid_schema' };
         }
 
-        return parsed.suggestions
+        const suggestions = parsed.suggestions
             .map(item => ({
                 quote: typeof item.quote === 'string' && item.quote.trim() ? item.quote.trim() : undefined,
                 comment: String(item.comment).trim(),
             }))
             .filter(suggestion => suggestion.comment.length > 0);
+        return { suggestions };
     }
 
     private buildContextPacket(
@@ -554,24 +574,10 @@ ${REVIEW_USER_SUFFIX}`;
         return Math.ceil(chars / 4);
     }
 
-    private buildBudgetCandidates(): BudgetCandidate[] {
-        return Object.entries(AI_REVIEW_MODELS).map(([key, config]) => ({
-            id: key,
-            model: config.model,
-            estimatedInputCostUsdPer1k: config.estimatedInputCostUsdPer1k,
-            estimatedOutputCostUsdPer1k: config.estimatedOutputCostUsdPer1k,
-            tags: config.tags,
-        }));
-    }
-
-    private getStablePromptPrefixHash(): string {
-        return createHash('sha256').update(`${REVIEW_SYSTEM_PROMPT}\n${REVIEW_USER_PREFIX}\n${REVIEW_USER_SUFFIX}`).digest('hex');
-    }
-
     private buildProviderOptions(modelConfig: AiReviewModelConfig): ChatOptions['providerOptions'] {
         const providerOptions: NonNullable<ChatOptions['providerOptions']> = {
             promptCaching: {
-                key: `ai-review:${this.getStablePromptPrefixHash()}`,
+                key: `ai-review:${STABLE_PROMPT_PREFIX_HASH}`,
                 retention: 'in_memory',
             },
         };
@@ -594,10 +600,7 @@ ${REVIEW_USER_SUFFIX}`;
         facts: StateSnapshotFact[]
     ): number {
         const previous = this.runState.get(runId);
-        const factMap = new Map<string, StateSnapshotFact>();
-        for (const fact of previous?.facts ?? []) {
-            factMap.set(fact.k, fact);
-        }
+        const factMap = new Map<string, StateSnapshotFact>((previous?.facts ?? []).map(fact => [fact.k, fact]));
         for (const fact of facts) {
             factMap.set(fact.k, fact);
         }
@@ -33,8 +33,8 @@ export class SettingsManager {
    * Load global settings from file
    */
   async loadSettings(): Promise<GlobalSettings> {
-    await this.ensureSettingsDir();
-
+    // Runtime settings are re-read on every dispatch resolution, so the read path does not
+    // create the directory; saveSettings does that when the file is first written.
     try {
       const content = await fs.readFile(this.settingsPath, 'utf-8');
       const trimmedContent = content.trim();
@@ -29,7 +29,7 @@ export class SpecWatcher extends EventEmitter {
   private parser: ISpecParser;
   private watcher?: FSWatcher;
   private pendingChanges: Map<string, { action: 'created' | 'updated' | 'deleted'; timer: NodeJS.Timeout }> = new Map();
-  private readonly DEBOUNCE_MS = 500;
+  private static readonly DEBOUNCE_MS = 500;
 
   constructor(projectPath: string, parser: ISpecParser) {
     super();
@@ -106,7 +106,7 @@ export class SpecWatcher extends EventEmitter {
     const timer = setTimeout(() => {
       this.pendingChanges.delete(filePath);
       this.handleFileChange(finalAction, filePath);
-    }, this.DEBOUNCE_MS);
+    }, SpecWatcher.DEBOUNCE_MS);
 
     this.pendingChanges.set(filePath, { action: finalAction, timer });
   }
@@ -1,7 +1,6 @@
 #!/usr/bin/env node
 
 import { createConfig } from './config.js';
-import { SpecContextServer } from './server.js';
 
 async function main(): Promise<void> {
     const args = process.argv.slice(2);
@@ -47,8 +46,10 @@ For Claude Desktop, add to your config:
         process.exit(exitCode);
     }
 
-    // Create config and server
+    // Create config and server. The server module pulls in the MCP SDK and every tool,
+    // so load it only here; --help and doctor never need it.
     const config = createConfig();
+    const { SpecContextServer } = await import('./server.js');
     const server = new SpecContextServer(config);
 
     // Run server
@@ -103,12 +103,17 @@ export class SnapshotManager {
         console.log(`[SnapshotManager] Loading snapshot from: ${this.snapshotFilePath}`);
 
         try {
-            if (!fs.existsSync(this.snapshotFilePath)) {
-                console.log('[SnapshotManager] No snapshot file found. Starting fresh.');
-                return;
+            let data: string;
+            try {
+                data = fs.readFileSync(this.snapshotFilePath, 'utf8');
+            } catch (error) {
+                if ((error as NodeJS.ErrnoException).code === 'ENOENT') {
+                    console.log('[SnapshotManager] No snapshot file found. Starting fresh.');
+                    return;
+                }
+                throw error;
             }
 
-            const data = fs.readFileSync(this.snapshotFilePath, 'utf8');
             const snapshot: CodebaseSnapshot = JSON.parse(data);
 
             // Validate codebases still exist
@@ -129,10 +134,7 @@ export class SnapshotManager {
 
     public saveSnapshot(): void {
         try {
-            const snapshotDir = path.dirname(this.snapshotFilePath);
-            if (!fs.existsSync(snapshotDir)) {
-                fs.mkdirSync(snapshotDir, { recursive: true });
-            }
+            fs.mkdirSync(path.dirname(this.snapshotFilePath), { recursive: true });
 
             const codebases: Record<string, CodebaseInfo> = {};
             for (const [codebasePath, info] of this.codebaseInfoMap) {
@@ -20,7 +20,7 @@ import { getSharedFileContentCache } from './core/cache/shared-file-content-cach
 
 export class SpecContextServer {
     private server: Server;
-    private config: SpecContextConfig;
+    private readonly config: SpecContextConfig;
 
     constructor(config: SpecContextConfig) {
         this.config = config;
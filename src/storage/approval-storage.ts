@@ -2,7 +2,7 @@ import { EventEmitter } from 'events';
 import { promises as fs } from 'fs';
 import { join, isAbsolute, resolve, basename } from 'path';
 import chokidar, { FSWatcher } from 'chokidar';
-import { diffLines, Change } from 'diff';
+import type { Change } from 'diff';
 import { PathUtils } from '../core/workflow/path-utils.js';
 
 export interface ApprovalComment {
@@ -114,7 +114,7 @@ export class ApprovalStorage extends EventEmitter {
   private approvalsDir: string;
   private watcher?: FSWatcher;
   private pendingEmit: NodeJS.Timeout | null = null;
-  private readonly DEBOUNCE_MS = 500;
+  private static readonly DEBOUNCE_MS = 500;
 
   constructor(translatedPath: string, originalPath?: string) {
     super();
@@ -181,7 +181,7 @@ export class ApprovalStorage extends EventEmitter {
     this.pendingEmit = setTimeout(() => {
       this.pendingEmit = null;
       this.emit('approval-change');
-    }, this.DEBOUNCE_MS);
+    }, ApprovalStorage.DEBOUNCE_MS);
   }
 
   async stop(): Promise<void> {
@@ -424,8 +424,11 @@ export class ApprovalStorage extends EventEmitter {
         }
       }
 
-      // Sort by creation date (newest first)
-      return approvals.sort((a, b) => new Date(b.createdAt).getTime() - new Date(a.createdAt).getTime());
+      // Sort by creation date (newest first); parse each timestamp once rather than per comparison
+      return approvals
+        .map(approval => ({ approval, createdAt: new Date(approval.createdAt).getTime() }))
+        .sort((a, b) => b.createdAt - a.createdAt)
+        .map(entry => entry.approval);
     } catch (error) {
       if (isNotFoundError(error)) {
         return [];
@@ -659,6 +662,8 @@ export class ApprovalStorage extends EventEmitter {
       toContent = toSnapshot.content;
     }
 
+    // Only the dashboard diff view gets here, so the MCP server never loads the diff library.
+    const { diffLines } = await import('diff');
     const changes: Change[] = diffLines(fromContent, toContent);
 
     const resultLines: DiffLine[] = [];
@@ -2,6 +2,7 @@ import type { ToolContext as WorkflowToolContext, ToolResponse } from '../workfl
 import { filterVisibleTools } from './registry.js';
 import { TOOL_CATALOG_ORDER, type ToolName } from './catalog.js';
 import { mkdir, readdir, rm, stat, writeFile } from 'fs/promises';
+import type { Dirent } from 'fs';
 import { join, relative } from 'path';
 import { randomUUID } from 'crypto';
 
@@ -57,17 +58,32 @@ interface OffloadConfig {
     ttlMinutes: number;
 }
 
-function readOffloadConfig(): OffloadConfig {
-    const parsedThreshold = Number(process.env.SPEC_CONTEXT_TOOL_RESULT_OFFLOAD_CHARS ?? 20000);
-    const parsedPreview = Number(process.env.SPEC_CONTEXT_TOOL_RESULT_PREVIEW_CHARS ?? 1200);
-    const parsedPreviewLines = Number(process.env.SPEC_CONTEXT_TOOL_RESULT_PREVIEW_LINES ?? 10);
-    const parsedTtlMinutes = Number(process.env.SPEC_CONTEXT_TOOL_RESULT_TTL_MINUTES ?? 30);
-    return {
-        thresholdChars: Number.isFinite(parsedThreshold) && parsedThreshold > 0 ? parsedThreshold : 20000,
-        previewChars: Number.isFinite(parsedPreview) && parsedPreview > 0 ? parsedPreview : 1200,
-        previewLines: Number.isFinite(parsedPreviewLines) && parsedPreviewLines > 0 ? parsedPreviewLines : 10,
-        ttlMinutes: Number.isFinite(parsedTtlMinutes) && parsedTtlMinutes > 0 ? parsedTtlMinutes : 30,
-    };
+// Every offload setting is a positive number with a default, so one table drives them all.
+const OFFLOAD_CONFIG_ENV: ReadonlyArray<readonly [keyof OffloadConfig, string, number]> = [
+    ['thresholdChars', 'SPEC_CONTEXT_TOOL_RESULT_OFFLOAD_CHARS', 20000],
+    ['previewChars', 'SPEC_CONTEXT_TOOL_RESULT_PREVIEW_CHARS', 1200],
+    ['previewLines', 'SPEC_CONTEXT_TOOL_RESULT_PREVIEW_LINES', 10],
+    ['ttlMinutes', 'SPEC_CONTEXT_TOOL_RESULT_TTL_MINUTES', 30],
+];
+
+// Returned as-is when none of the offload variables are set, the usual deployment.
+const DEFAULT_OFFLOAD_CONFIG: Readonly<OffloadConfig> = Object.freeze(
+    Object.fromEntries(OFFLOAD_CONFIG_ENV.map(([field, , defaultValue]) => [field, defaultValue])) as OffloadConfig
+);
+
+function readOffloadConfig(): Readonly<OffloadConfig> {
+    const env = process.env;
+    const rawValues = OFFLOAD_CONFIG_ENV.map(([, envVar]) => env[envVar]);
+    if (rawValues.every(value => value === undefined)) {
+        return DEFAULT_OFFLOAD_CONFIG;
+    }
+
+    const config = {} as OffloadConfig;
+    OFFLOAD_CONFIG_ENV.forEach(([field, , defaultValue], index) => {
+        const parsed = Number(rawValues[index] ?? defaultValue);
+        config[field] = Number.isFinite(parsed) && parsed > 0 ? parsed : defaultValue;
+    });
+    return config;
 }
 
 function serializeToolData(data: unknown): { serialized: string; contentType: 'text' | 'json' } | null {
@@ -106,31 +122,35 @@ function isMeaningfulPreviewLine(line: string): boolean {
 }
 
 function buildMeaningfulPreview(serialized: string, maxLines: number, maxChars: number): string {
-    const lines = serialized.split(/\r?\n/);
-    const selected: string[] = [];
-    for (const line of lines) {
+    // Walk lines in place so offloaded payloads are never split into a full line array.
+    let preview = '';
+    let selectedCount = 0;
+    let cursor = 0;
+    while (cursor <= serialized.length && selectedCount < maxLines && preview.length <= maxChars) {
+        const newlineIndex = serialized.indexOf('\n', cursor);
+        const lineEnd = newlineIndex === -1 ? serialized.length : newlineIndex;
+        const line = serialized.slice(cursor, lineEnd);
+        cursor = lineEnd + 1;
         if (!isMeaningfulPreviewLine(line)) {
             continue;
         }
-        selected.push(line.trim());
-        if (selected.length >= maxLines) {
-            break;
-        }
+        preview += selectedCount === 0 ? line.trim() : `\n${line.trim()}`;
+        selectedCount += 1;
     }
 
-    if (selected.length === 0) {
+    if (selectedCount === 0) {
         return clipPreview(serialized.trim(), maxChars);
     }
 
-    return clipPreview(selected.join('\n'), maxChars);
+    return clipPreview(preview, maxChars);
 }
 
 async function cleanupExpiredOffloads(outputDir: string, ttlMinutes: number): Promise<void> {
     const ttlMs = ttlMinutes * 60 * 1000;
     const cutoff = Date.now() - ttlMs;
-    let entries: string[] = [];
+    let entries: Dirent[] = [];
     try {
-        entries = await readdir(outputDir);
+        entries = await readdir(outputDir, { withFileTypes: true });
     } catch (error) {
         if (typeof error === 'object' && error !== null && 'code' in error && (error as { code?: unknown }).code === 'ENOENT') {
             return;
@@ -138,13 +158,11 @@ async function cleanupExpiredOffloads(outputDir: string, ttlMinutes: number): Pr
         throw error;
     }
 
-    await Promise.all(entries.map(async entry => {
-        const entryPath = join(outputDir, entry);
+    // Directory entries already carry their type, so only regular files get stat'ed.
+    await Promise.all(entries.filter(entry => entry.isFile()).map(async entry => {
+        const entryPath = join(outputDir, entry.name);
         try {
             const fileStat = await stat(entryPath);
-            if (!fileStat.isFile()) {
-                return;
-            }
             if (fileStat.mtimeMs < cutoff) {
                 await rm(entryPath, { force: true });
             }
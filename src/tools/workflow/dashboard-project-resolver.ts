@@ -19,9 +19,13 @@ export function getProjectBaseName(projectPath: string): string {
   return segments[segments.length - 1];
 }
 
-function pathMatchesBaseName(candidatePath: string, projectBaseName: string): boolean {
-  const normalized = candidatePath.replace(/\\/g, '/');
-  return normalized === projectBaseName || normalized.endsWith(`/${projectBaseName}`);
+function makeBaseNameMatcher(projectBaseName: string): (candidatePath: string) => boolean {
+  const baseNameSuffix = `/${projectBaseName}`;
+  return (candidatePath) => {
+    // POSIX paths (the common case) carry no backslashes, so skip the rewrite.
+    const normalized = candidatePath.includes('\\') ? candidatePath.replace(/\\/g, '/') : candidatePath;
+    return normalized === projectBaseName || normalized.endsWith(baseNameSuffix);
+  };
 }
 
 export function findDashboardProjectByPath(
@@ -29,7 +33,7 @@ export function findDashboardProjectByPath(
   validatedProjectPath: string,
   translatedProjectPath: string
 ): DashboardProject | null {
-  const projectBaseName = getProjectBaseName(validatedProjectPath);
+  const matchesBaseName = makeBaseNameMatcher(getProjectBaseName(validatedProjectPath));
 
   for (const project of projects) {
     if (!project.projectPath) {
@@ -38,7 +42,7 @@ export function findDashboardProjectByPath(
     if (
       project.projectPath === translatedProjectPath
       || project.projectPath === validatedProjectPath
-      || pathMatchesBaseName(project.projectPath, projectBaseName)
+      || matchesBaseName(project.projectPath)
     ) {
       return project;
     }
@@ -35,6 +35,14 @@ export interface ReviewerResult {
   required_fixes: string[];
 }
 
+const IMPLEMENTER_STATUSES: ReadonlySet<string> = new Set<ImplementerResult['status']>(['completed', 'blocked', 'failed']);
+const REVIEWER_ISSUE_SEVERITIES: ReadonlySet<string> = new Set<ReviewerIssue['severity']>(['critical', 'important', 'minor']);
+const REVIEWER_ASSESSMENTS: ReadonlySet<string> = new Set<ReviewerResult['assessment']>(['approved', 'needs_changes', 'blocked']);
+
+function isOneOf(value: unknown, allowed: ReadonlySet<string>): boolean {
+  return typeof value === 'string' && allowed.has(value);
+}
+
 function isRecord(value: unknown): value is Record<string, unknown> {
   return typeof value === 'object' && value !== null;
 }
@@ -50,7 +58,7 @@ export function isImplementerResult(value: unknown): value is ImplementerResult
   if (typeof value.task_id !== 'string') {
     return false;
   }
-  if (!['completed', 'blocked', 'failed'].includes(String(value.status))) {
+  if (!isOneOf(value.status, IMPLEMENTER_STATUSES)) {
     return false;
   }
   if (typeof value.summary !== 'string') {
@@ -84,7 +92,7 @@ export function isReviewerIssue(value: unknown): value is ReviewerIssue {
   if (!isRecord(value)) {
     return false;
   }
-  if (!['critical', 'important', 'minor'].includes(String(value.severity))) {
+  if (!isOneOf(value.severity, REVIEWER_ISSUE_SEVERITIES)) {
     return false;
   }
   if (typeof value.message !== 'string' || typeof value.fix !== 'string') {
@@ -103,7 +111,7 @@ export function isReviewerResult(value: unknown): value is ReviewerResult {
   if (typeof value.task_id !== 'string') {
     return false;
   }
-  if (!['approved', 'needs_changes', 'blocked'].includes(String(value.assessment))) {
+  if (!isOneOf(value.assessment, REVIEWER_ASSESSMENTS)) {
     return false;
   }
   if (!isStringArray(value.strengths) || !isStringArray(value.required_fixes)) {
@@ -92,6 +92,23 @@ describe('dispatch-ledger', () => {
     }
   });
 
+  it('re-extracts updated totals after tasks.md changes', async () => {
+    const projectPath = await createTempProject();
+    try {
+      const sourcePath = await writeTasks(projectPath, 'spec-c');
+      const first = await extractProgressLedger({ specName: 'spec-c', taskId: '1.2', sourcePath });
+      const again = await extractProgressLedger({ specName: 'spec-c', taskId: '1.2', sourcePath });
+      expect(again.totals).toEqual(first.totals);
+
+      await writeFile(sourcePath, TASKS_CONTENT.replace('[-] 1.2', '[x] 1.2'), 'utf8');
+      const updated = await extractProgressLedger({ specName: 'spec-c', taskId: '1.2', sourcePath });
+      expect(updated.totals.completed).toBe(2);
+      expect(updated.sourceFingerprint.hash).not.toBe(first.sourceFingerprint.hash);
+    } finally {
+      await rm(projectPath, { recursive: true, force: true });
+    }
+  });
+
   it('updates stalled state and replan hint deterministically', () => {
     const baseline = taskLedgerFromFacts({
       runId: 'run-1',
@@ -1,8 +1,9 @@
 import { createHash } from 'crypto';
 import { promises as fs } from 'fs';
 import { resolve } from 'path';
+import { setBoundedMapEntry } from '../../core/cache/bounded-map.js';
 import type { StateSnapshotFact } from '../../core/llm/index.js';
-import { parseTasksFromMarkdown } from '../../core/workflow/task-parser.js';
+import { parseTasksFromMarkdown, type TaskParserResult } from '../../core/workflow/task-parser.js';
 import type { ImplementerResult, ReviewerResult } from './dispatch-contract-schemas.js';
 
 export type LedgerMode = 'ledger_only';
@@ -160,6 +161,21 @@ function dedupeStrings(values: string[]): string[] {
   return deduped;
 }
 
+// Parsed tasks.md results keyed by content hash, so repeated dispatches against an
+// unchanged file skip re-parsing the markdown.
+const parsedTasksByHash = new Map<string, TaskParserResult>();
+const MAX_PARSED_TASKS_CACHE_ENTRIES = 32;
+
+function parseTasksCached(content: string, contentHash: string): TaskParserResult {
+  const cached = parsedTasksByHash.get(contentHash);
+  if (cached) {
+    return cached;
+  }
+  const parsed = parseTasksFromMarkdown(content);
+  setBoundedMapEntry(parsedTasksByHash, contentHash, parsed, MAX_PARSED_TASKS_CACHE_ENTRIES);
+  return parsed;
+}
+
 export async function extractProgressLedger(args: {
   specName: string;
   taskId: string;
@@ -178,7 +194,8 @@ export async function extractProgressLedger(args: {
     throw error;
   }
 
-  const parsed = parseTasksFromMarkdown(content);
+  const contentHash = hashText(content);
+  const parsed = parseTasksCached(content, contentHash);
   if (parsed.tasks.length === 0) {
     throw new DispatchLedgerError(
       'progress_ledger_parse_failed',
@@ -196,7 +213,7 @@ export async function extractProgressLedger(args: {
     sourcePath: args.sourcePath,
     sourceFingerprint: {
       mtimeMs,
-      hash: hashText(content),
+      hash: contentHash,
     },
     totals: {
       total: parsed.summary.total,
@@ -212,7 +229,7 @@ export async function extractProgressLedger(args: {
           description: currentTask.description,
           status: currentTask.status,
           ...(currentTask.prompt ? { prompt: currentTask.prompt } : {}),
-          ...(currentTask.requirements ? { requirements: currentTask.requirements } : {}),
+          ...(currentTask.requirements ? { requirements: [...currentTask.requirements] } : {}),
         },
       }
       : {}),
@@ -656,9 +673,23 @@ export function buildLedgerTaskPrompt(
 }
 
 function formatReviewerIssue(issue: TaskLedgerIssue): string {
-  const prefix = `[${issue.severity}]`;
-  return issue.file ? `${prefix} ${issue.file}: ${issue.message}` : `${prefix} ${issue.message}`;
-}
+  // One template per branch; no intermediate prefix string per issue.
+  return issue.file
+    ? `[${issue.severity}] ${issue.file}: ${issue.message}`
+    : `[${issue.severity}] ${issue.message}`;
+}
+
+const SUGGESTED_NEXT_ACTION_BY_ASSESSMENT: Record<
+  NonNullable<TaskLedger['reviewerAssessment']>,
+  (ledger: TaskLedger) => string
+> = {
+  approved: () => 'dispatch implementer for next task',
+  needs_changes: () => 'dispatch implementer to address feedback',
+  blocked: (ledger) => {
+    const blockerDetails = ledger.blockers.length > 0 ? `:\n${ledger.blockers.join('\n')}` : '';
+    return `blocked - resolve blockers${blockerDetails}`;
+  },
+};
 
 export function buildResumptionPrompt(args: {
   taskLedger: TaskLedger;
@@ -716,15 +747,10 @@ export function buildResumptionPrompt(args: {
     sections.push('Staleness warning:\ntasks.md has changed since last session');
   }
 
-  if (args.taskLedger.reviewerAssessment === 'approved') {
-    sections.push('Suggested next action:\ndispatch implementer for next task');
-  } else if (args.taskLedger.reviewerAssessment === 'needs_changes') {
-    sections.push('Suggested next action:\ndispatch implementer to address feedback');
-  } else if (args.taskLedger.reviewerAssessment === 'blocked') {
-    const blockerDetails = args.taskLedger.blockers.length > 0
-      ? `:\n${args.taskLedger.blockers.join('\n')}`
-      : '';
-    sections.push(`Suggested next action:\nblocked - resolve blockers${blockerDetails}`);
+  const assessment = args.taskLedger.reviewerAssessment;
+  const buildSuggestedNextAction = assessment ? SUGGESTED_NEXT_ACTION_BY_ASSESSMENT[assessment] : undefined;
+  if (buildSuggestedNextAction) {
+    sections.push(`Suggested next action:\n${buildSuggestedNextAction(args.taskLedger)}`);
   }
 
   return sections.join('\n\n');
@@ -742,11 +768,7 @@ export function buildFailureEvidence(ledger: TaskLedger): string | null {
   }
 
   if (ledger.reviewerIssues.length > 0) {
-    const formatted = ledger.reviewerIssues.map((issue) => {
-      const prefix = `[${issue.severity}]`;
-      return issue.file ? `${prefix} ${issue.file}: ${issue.message}` : `${prefix} ${issue.message}`;
-    });
-    sections.push(`Rejection reasons:\n${formatted.join('\n')}`);
+    sections.push(`Rejection reasons:\n${ledger.reviewerIssues.map(formatReviewerIssue).join('\n')}`);
   }
 
   if (ledger.requiredFixes.length > 0) {
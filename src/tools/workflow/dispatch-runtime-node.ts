@@ -241,12 +241,33 @@ class NodeDispatchRuntimeManager extends DispatchRuntimeManager {
   }
 }
 
+interface DispatchRolePromptProfile {
+  templateId: string;
+  prefixModel: string;
+  guideToolName: string;
+}
+
+// Role-specific names are fixed, so resolve them by lookup instead of re-branching on
+// every compile (a single dispatch can compile up to five times during compaction).
+const DISPATCH_ROLE_PROMPT_PROFILES: Record<'implementer' | 'reviewer', DispatchRolePromptProfile> = {
+  implementer: {
+    templateId: 'dispatch_implementer',
+    prefixModel: 'implementer-dispatch',
+    guideToolName: 'get-implementer-guide',
+  },
+  reviewer: {
+    templateId: 'dispatch_reviewer',
+    prefixModel: 'reviewer-dispatch',
+    guideToolName: 'get-reviewer-guide',
+  },
+};
+
 function buildDispatchGuideInstruction(input: {
   role: 'implementer' | 'reviewer';
   guideMode: 'full' | 'compact';
   runId: string;
 }): string {
-  const guideToolName = input.role === 'implementer' ? 'get-implementer-guide' : 'get-reviewer-guide';
+  const { guideToolName } = DISPATCH_ROLE_PROMPT_PROFILES[input.role];
   if (input.guideMode === 'full') {
     return `Guide policy: first dispatch for this role in run ${input.runId}. Call ${guideToolName} with {"mode":"full","runId":"${input.runId}"} exactly once before coding/reviewing.`;
   }
@@ -264,22 +285,21 @@ function buildDispatchDynamicTail(input: {
   guideCacheKey: string;
   sessionContext?: string;
 }): string {
-  const sections = [
-    `Task ID: ${input.taskId}`,
-    `Max output tokens: ${input.maxOutputTokens}`,
-    `Delta context: ${JSON.stringify(input.deltaPacket)}`,
-    `Guide cache key: ${input.guideCacheKey}`,
-    buildDispatchGuideInstruction({
-      role: input.role,
-      guideMode: input.guideMode,
-      runId: input.runId,
-    }),
-  ];
-  if (input.sessionContext && input.sessionContext.trim()) {
-    sections.push(input.sessionContext.trim());
-  }
-  sections.push('Task prompt:', input.taskPrompt);
-  return sections.join('\n');
+  // The line count is fixed apart from the optional session block, so build the
+  // tail in one template rather than growing and joining an array per compile.
+  const guideInstruction = buildDispatchGuideInstruction({
+    role: input.role,
+    guideMode: input.guideMode,
+    runId: input.runId,
+  });
+  const sessionContext = input.sessionContext?.trim();
+  const sessionBlock = sessionContext ? `${sessionContext}\n` : '';
+  return `Task ID: ${input.taskId}\n`
+    + `Max output tokens: ${input.maxOutputTokens}\n`
+    + `Delta context: ${JSON.stringify(input.deltaPacket)}\n`
+    + `Guide cache key: ${input.guideCacheKey}\n`
+    + `${guideInstruction}\n`
+    + `${sessionBlock}Task prompt:\n${input.taskPrompt}`;
 }
 
 function estimateTokensFromChars(value: string, charsPerToken = DEFAULT_TOKEN_CHARS_PER_TOKEN): number {
@@ -372,11 +392,11 @@ ${DISPATCH_RESULT_MARKERS.end}`,
     sessionContext?: string;
     tokenCharsPerToken?: number;
   }): CompiledDispatchPrompt {
-    const templateId = input.role === 'implementer' ? 'dispatch_implementer' : 'dispatch_reviewer';
+    const profile = DISPATCH_ROLE_PROMPT_PROFILES[input.role];
     const dynamicTail = buildDispatchDynamicTail(input);
-    const compiled = this.registry.compile(templateId, this.version, dynamicTail);
+    const compiled = this.registry.compile(profile.templateId, this.version, dynamicTail);
     const prefixCompile = this.prefixCompiler.compile({
-      model: `${input.role}-dispatch`,
+      model: profile.prefixModel,
       messages: [
         { role: 'system', content: compiled.stablePrefix },
         { role: 'user', content: dynamicTail },
@@ -1217,6 +1217,56 @@ END_DISPATCH_RESULT`,
     expect(result.data?.errorCode).toBe('dispatch_prompt_overflow_terminal');
   });
 
+  it('sheds an oversized session facts block before compacting the task prompt', async () => {
+    const classifier: ITaskComplexityClassifier = {
+      classify: () => ({
+        level: 'complex',
+        confidence: 1,
+        features: [],
+        classifierId: 'test-classifier',
+      }),
+    };
+    const oversizedFacts = Array.from({ length: 400 }, (_, index) => ({
+      id: `fact-${index}`,
+      subject: `src/module-${index}.ts`,
+      relation: 'modified_by',
+      object: `task:${index} ${'detail '.repeat(20)}`,
+      tags: ['file_change'],
+      validFrom: new Date('2025-01-01T00:00:00.000Z'),
+      validTo: undefined,
+      sourceTaskId: String(index),
+      sourceRole: 'implementer',
+      confidence: 1,
+    }));
+    const factStore = new InMemorySessionFactStore();
+    const manager = new DispatchRuntimeManagerClass(
+      classifier,
+      factStore,
+      new RuleBasedFactExtractor(),
+      { retrieve: vi.fn().mockReturnValue(oversizedFacts) } as any,
+      createNodeDispatchRuntimeManagerDependencies(),
+    );
+    const runId = 'test-run-compaction-session-facts';
+    const taskPrompt = 'Implement task 1.1 and keep every line of this prompt';
+
+    await manager.initRun(runId, SPEC_NAME, '1.1', context.projectPath);
+    const compiled = await manager.compilePrompt({
+      runId,
+      role: 'implementer',
+      taskId: '1.1',
+      projectPath: context.projectPath,
+      maxOutputTokens: 400,
+      taskPrompt,
+      compactionAuto: true,
+    });
+
+    expect(compiled.compactionStage).toBe('session_facts_shed');
+    expect(compiled.compactionTrace.map(entry => entry.stage)).toEqual(['initial', 'session_facts_shed']);
+    expect(compiled.prompt).not.toContain('[Session Context]');
+    expect(compiled.prompt.endsWith(`Task prompt:\n${taskPrompt}`)).toBe(true);
+    expect(manager.getTelemetrySnapshot().compaction_stage_distribution.session_facts_shed).toBe(1);
+  });
+
   it('resume_run returns run_not_found when snapshot is missing', async () => {
     const result = await dispatchRuntimeHandler(
       {
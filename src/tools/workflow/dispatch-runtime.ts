@@ -124,20 +124,23 @@ class DispatchRuntimeError extends Error {
   }
 }
 
+function findSingleOccurrence(value: string, marker: string): number {
+  const index = value.indexOf(marker);
+  return index !== -1 && index === value.lastIndexOf(marker) ? index : -1;
+}
+
 function extractStructuredJson(rawOutput: string): unknown {
   const trimmed = rawOutput.trim();
-  const beginCount = (trimmed.match(new RegExp(DISPATCH_RESULT_BEGIN, 'g')) ?? []).length;
-  const endCount = (trimmed.match(new RegExp(DISPATCH_RESULT_END, 'g')) ?? []).length;
+  const beginIndex = findSingleOccurrence(trimmed, DISPATCH_RESULT_BEGIN);
+  const endIndex = findSingleOccurrence(trimmed, DISPATCH_RESULT_END);
 
-  if (beginCount !== 1 || endCount !== 1) {
+  if (beginIndex === -1 || endIndex === -1) {
     throw new DispatchContractError(
       'marker_missing',
       `Invalid dispatch contract markers; expected exactly one ${DISPATCH_RESULT_BEGIN}/${DISPATCH_RESULT_END} block`,
     );
   }
 
-  const beginIndex = trimmed.indexOf(DISPATCH_RESULT_BEGIN);
-  const endIndex = trimmed.indexOf(DISPATCH_RESULT_END);
   const jsonBody = trimmed
     .slice(beginIndex + DISPATCH_RESULT_BEGIN.length, endIndex)
     .trim();
@@ -212,20 +215,29 @@ export interface ComplianceEvidence {
   filesChanged: string[];
 }
 
+const ACCEPTANCE_CRITERIA_LINE_RE = /^[^\S\n]*((?:\d+\.[^\S\n]*)?(?:WHEN|IF)\b.*\bSHALL\b.*)$/gim;
+
 export function extractAcceptanceCriteria(content: string): string[] {
-  return content
-    .split('\n')
-    .map(line => line.trim())
-    .filter(line => /^(?:\d+\.\s*)?(?:WHEN|IF)\b.*\bSHALL\b/i.test(line));
+  return Array.from(content.matchAll(ACCEPTANCE_CRITERIA_LINE_RE), match => match[1].trim());
 }
 
 export function filterComplianceFacts(facts: StateSnapshotFact[]): { taskOutcomes: string[]; filesChanged: string[] } {
-  const taskOutcomes = facts
-    .filter(f => f.k.includes('completed_with') || f.k.includes('reviewed_as'))
-    .map(f => `${f.k}: ${f.v}`);
-  const filesChanged = facts
-    .filter(f => f.k.includes('modified_by'))
-    .map(f => `${f.k}: ${f.v}`);
+  const taskOutcomes: string[] = [];
+  const filesChanged: string[] = [];
+  for (const fact of facts) {
+    const isOutcome = fact.k.includes('completed_with') || fact.k.includes('reviewed_as');
+    const isFileChange = fact.k.includes('modified_by');
+    if (!isOutcome && !isFileChange) {
+      continue;
+    }
+    const line = `${fact.k}: ${fact.v}`;
+    if (isOutcome) {
+      taskOutcomes.push(line);
+    }
+    if (isFileChange) {
+      filesChanged.push(line);
+    }
+  }
   return { taskOutcomes, filesChanged };
 }
 
@@ -240,14 +252,15 @@ const STAGE_B_TAIL_LINES = 8;
 const STAGE_B_OBJECTIVE_CHARS = 900;
 const STAGE_C_OBJECTIVE_CHARS = 420;
 
-type DispatchCompactionStage = 'none' | 'stage_a_prune' | 'stage_b_prompt' | 'stage_c_fallback';
+type DispatchCompactionStage = 'none' | 'session_facts_shed' | 'stage_a_prune' | 'stage_b_prompt' | 'stage_c_fallback';
 
+// Resolved once per runtime and read on every compile, so it is never mutated in place.
 export interface DispatchCompactionPolicy {
-  auto: boolean;
-  prune: boolean;
-  maxInputTokensImplementer: number;
-  maxInputTokensReviewer: number;
-  tokenCharsPerToken: number;
+  readonly auto: boolean;
+  readonly prune: boolean;
+  readonly maxInputTokensImplementer: number;
+  readonly maxInputTokensReviewer: number;
+  readonly tokenCharsPerToken: number;
 }
 
 interface DispatchCompactionTrace {
@@ -266,15 +279,18 @@ export interface CompiledDispatchPrompt {
   promptTokens: number;
 }
 
+const TRUE_ENV_VALUES: ReadonlySet<string> = new Set(['1', 'true', 'yes', 'on']);
+const FALSE_ENV_VALUES: ReadonlySet<string> = new Set(['0', 'false', 'no', 'off']);
+
 function boolFromEnv(raw: string | undefined, defaultValue: boolean, envVarName: string): boolean {
   if (!raw) {
     return defaultValue;
   }
   const normalized = raw.trim().toLowerCase();
-  if (['1', 'true', 'yes', 'on'].includes(normalized)) {
+  if (TRUE_ENV_VALUES.has(normalized)) {
     return true;
   }
-  if (['0', 'false', 'no', 'off'].includes(normalized)) {
+  if (FALSE_ENV_VALUES.has(normalized)) {
     return false;
   }
   throw new Error(`${envVarName} must be a boolean-like value (1/0/true/false/yes/no/on/off)`);
@@ -304,6 +320,19 @@ function clipText(value: string, maxChars: number): string {
   return `${value.slice(0, maxChars - 3)}...`;
 }
 
+// Same result as clipText(parts.join(separator), maxChars), but stops
+// assembling once the clip point is passed instead of joining every part.
+function joinClipped(parts: string[], separator: string, maxChars: number): string {
+  let joined = '';
+  for (const [index, part] of parts.entries()) {
+    joined += index === 0 ? part : `${separator}${part}`;
+    if (joined.length > maxChars) {
+      break;
+    }
+  }
+  return clipText(joined, maxChars);
+}
+
 function normalizeLine(line: string): string {
   return line.replace(/\s+/g, ' ').trim();
 }
@@ -341,10 +370,22 @@ function buildDispatchOutputPaths(input: {
   };
 }
 
-function uniqueNonEmptyLines(lines: string[]): string[] {
+// Callers only keep the first few matches, so stop scanning once `limit` lines are collected
+// instead of filtering and deduping the whole prompt and slicing afterwards.
+function uniqueNonEmptyLines(
+  lines: string[],
+  limit = Number.POSITIVE_INFINITY,
+  include?: (line: string) => boolean
+): string[] {
   const seen = new Set<string>();
   const result: string[] = [];
   for (const line of lines) {
+    if (result.length >= limit) {
+      break;
+    }
+    if (include && !include(line)) {
+      continue;
+    }
     const normalized = normalizeLine(line);
     if (!normalized || seen.has(normalized)) {
       continue;
@@ -363,7 +404,7 @@ function compactTaskPromptStageB(input: {
   taskPrompt: string;
   taskId: string;
   maxOutputTokens: number;
-  compactionContext?: string[];
+  compactionContextLines: string[];
 }): string {
   const normalizedPrompt = normalizePromptText(input.taskPrompt);
   if (!normalizedPrompt) {
@@ -374,9 +415,9 @@ function compactTaskPromptStageB(input: {
   const nonEmpty = lines.filter(Boolean);
   const head = nonEmpty.slice(0, STAGE_B_HEAD_LINES);
   const tail = nonEmpty.slice(Math.max(0, nonEmpty.length - STAGE_B_TAIL_LINES));
-  const critical = uniqueNonEmptyLines(nonEmpty.filter(containsCriticalConstraint)).slice(0, 16);
-  const objective = clipText(nonEmpty.join(' '), STAGE_B_OBJECTIVE_CHARS);
-  const contextLines = uniqueNonEmptyLines(input.compactionContext ?? []).slice(0, 8);
+  const critical = uniqueNonEmptyLines(nonEmpty, 16, containsCriticalConstraint);
+  const objective = joinClipped(nonEmpty, ' ', STAGE_B_OBJECTIVE_CHARS);
+  const contextLines = input.compactionContextLines.slice(0, 8);
 
   const sections: string[] = [
     'Task prompt compacted due to input token budget pressure.',
@@ -405,18 +446,13 @@ function compactTaskPromptStageC(input: {
   taskPrompt: string;
   taskId: string;
   maxOutputTokens: number;
-  compactionContext?: string[];
+  compactionContextLines: string[];
   compactionPromptOverride?: string;
 }): string {
   const normalizedPrompt = normalizePromptText(input.taskPrompt);
   const objective = clipText(normalizeLine(normalizedPrompt), STAGE_C_OBJECTIVE_CHARS);
-  const critical = uniqueNonEmptyLines(
-    normalizedPrompt
-      .split('\n')
-      .map(line => line.trim())
-      .filter(containsCriticalConstraint)
-  ).slice(0, 8);
-  const contextLines = uniqueNonEmptyLines(input.compactionContext ?? []).slice(0, 4);
+  const critical = uniqueNonEmptyLines(normalizedPrompt.split('\n'), 8, containsCriticalConstraint);
+  const contextLines = input.compactionContextLines.slice(0, 4);
 
   const sections: string[] = [];
   if (input.compactionPromptOverride?.trim()) {
@@ -476,7 +512,7 @@ export function pruneDeltaPacket(deltaPacket: Record<string, unknown>): Record<s
 }
 
 export function resolveDispatchCompactionPolicyFromEnv(): DispatchCompactionPolicy {
-  return {
+  return Object.freeze({
     auto: boolFromEnv(process.env.SPEC_CONTEXT_DISPATCH_COMPACTION_AUTO, true, 'SPEC_CONTEXT_DISPATCH_COMPACTION_AUTO'),
     prune: boolFromEnv(process.env.SPEC_CONTEXT_DISPATCH_COMPACTION_PRUNE, true, 'SPEC_CONTEXT_DISPATCH_COMPACTION_PRUNE'),
     maxInputTokensImplementer: intFromEnv(
@@ -494,7 +530,7 @@ export function resolveDispatchCompactionPolicyFromEnv(): DispatchCompactionPoli
       DEFAULT_TOKEN_CHARS_PER_TOKEN,
       'SPEC_CONTEXT_DISPATCH_TOKEN_CHARS_PER_TOKEN',
     ),
-  };
+  });
 }
 
 export function resolveDispatchStalledThresholdFromEnv(): number {
@@ -656,6 +692,7 @@ export class DispatchRuntimeManager {
     compaction_ratio: 1,
     compaction_stage_distribution: {
       none: 0,
+      session_facts_shed: 0,
       stage_a_prune: 0,
       stage_b_prompt: 0,
       stage_c_fallback: 0,
@@ -1140,18 +1177,24 @@ export class DispatchRuntimeManager {
     const autoCompaction = args.compactionAuto ?? this.compactionPolicy.auto;
     const compactionTrace: DispatchCompactionTrace[] = [];
 
-    let compiled = this.promptCompiler.compile({
+    // Only the prompt, delta packet and session context vary between compaction
+    // stages; the rest of the compiler input is shared by every attempt.
+    const compileBase = {
       runId: args.runId,
       role: args.role,
-      taskPrompt,
       taskId: args.taskId,
       maxOutputTokens: args.maxOutputTokens,
-      deltaPacket,
       guideMode,
       guideCacheKey,
-      sessionContext,
       tokenCharsPerToken: this.compactionPolicy.tokenCharsPerToken,
-    });
+    };
+    const compileStage = (stage: {
+      taskPrompt: string;
+      deltaPacket: Record<string, unknown>;
+      sessionContext?: string;
+    }): CompiledDispatchPrompt => this.promptCompiler.compile({ ...compileBase, ...stage });
+
+    let compiled = compileStage({ taskPrompt, deltaPacket, sessionContext });
     const promptTokensBefore = compiled.promptTokens;
     compactionTrace.push({ stage: 'initial', promptTokens: compiled.promptTokens });
 
@@ -1166,20 +1209,25 @@ export class DispatchRuntimeManager {
         );
       }
 
-      if (this.compactionPolicy.prune) {
+      // Stages B and C both quote the caller's compaction context; dedupe it once.
+      const compactionContextLines = uniqueNonEmptyLines(args.compactionContext ?? []);
+
+      // Session facts are supplementary recall, so they go before anything that cuts
+      // into the delta packet or the task prompt itself.
+      let stageSessionContext: string | undefined = sessionContext;
+      if (sessionContext) {
+        const withoutFactsCompiled = compileStage({ taskPrompt, deltaPacket });
+        if (withoutFactsCompiled.promptTokens < compiled.promptTokens) {
+          compiled = withoutFactsCompiled;
+          stageSessionContext = undefined;
+          compactionStage = 'session_facts_shed';
+          compactionTrace.push({ stage: 'session_facts_shed', promptTokens: compiled.promptTokens });
+        }
+      }
+
+      if (compiled.promptTokens > promptBudget && this.compactionPolicy.prune) {
         deltaPacket = pruneDeltaPacket(deltaPacket);
-        const stageACompiled = this.promptCompiler.compile({
-          runId: args.runId,
-          role: args.role,
-          taskPrompt,
-          taskId: args.taskId,
-          maxOutputTokens: args.maxOutputTokens,
-          deltaPacket,
-          guideMode,
-          guideCacheKey,
-          sessionContext,
-          tokenCharsPerToken: this.compactionPolicy.tokenCharsPerToken,
-        });
+        const stageACompiled = compileStage({ taskPrompt, deltaPacket, sessionContext: stageSessionContext });
         if (stageACompiled.promptTokens <= compiled.promptTokens) {
           compiled = stageACompiled;
           compactionStage = 'stage_a_prune';
@@ -1192,20 +1240,9 @@ export class DispatchRuntimeManager {
           taskPrompt,
           taskId: args.taskId,
           maxOutputTokens: args.maxOutputTokens,
-          compactionContext: args.compactionContext,
-        });
-        const stageBCompiled = this.promptCompiler.compile({
-          runId: args.runId,
-          role: args.role,
-          taskPrompt,
-          taskId: args.taskId,
-          maxOutputTokens: args.maxOutputTokens,
-          deltaPacket,
-          guideMode,
-          guideCacheKey,
-          sessionContext,
-          tokenCharsPerToken: this.compactionPolicy.tokenCharsPerToken,
+          compactionContextLines,
         });
+        const stageBCompiled = compileStage({ taskPrompt, deltaPacket, sessionContext: stageSessionContext });
         if (stageBCompiled.promptTokens <= compiled.promptTokens) {
           compiled = stageBCompiled;
           compactionStage = 'stage_b_prompt';
@@ -1218,21 +1255,10 @@ export class DispatchRuntimeManager {
           taskPrompt,
           taskId: args.taskId,
           maxOutputTokens: args.maxOutputTokens,
-          compactionContext: args.compactionContext,
+          compactionContextLines,
           compactionPromptOverride: args.compactionPromptOverride,
         });
-        const stageCCompiled = this.promptCompiler.compile({
-          runId: args.runId,
-          role: args.role,
-          taskPrompt,
-          taskId: args.taskId,
-          maxOutputTokens: args.maxOutputTokens,
-          deltaPacket,
-          guideMode,
-          guideCacheKey,
-          sessionContext,
-          tokenCharsPerToken: this.compactionPolicy.tokenCharsPerToken,
-        });
+        const stageCCompiled = compileStage({ taskPrompt, deltaPacket, sessionContext: stageSessionContext });
         if (stageCCompiled.promptTokens <= compiled.promptTokens) {
           compiled = stageCCompiled;
           compactionStage = 'stage_c_fallback';
@@ -1521,10 +1547,7 @@ export class DispatchRuntimeManager {
   }
 
   private mergeFacts(existing: StateSnapshotFact[], incoming: StateSnapshotFact[]): StateSnapshotFact[] {
-    const map = new Map<string, StateSnapshotFact>();
-    for (const fact of existing) {
-      map.set(fact.k, fact);
-    }
+    const map = new Map<string, StateSnapshotFact>(existing.map(fact => [fact.k, fact]));
     for (const fact of incoming) {
       map.set(fact.k, fact);
     }
@@ -1701,10 +1724,10 @@ function parseCompactionAuto(value: unknown): { ok: true; value?: boolean } | {
   }
 
   const normalized = value.trim().toLowerCase();
-  if (['1', 'true', 'yes', 'on'].includes(normalized)) {
+  if (TRUE_ENV_VALUES.has(normalized)) {
     return { ok: true, value: true };
   }
-  if (['0', 'false', 'no', 'off'].includes(normalized)) {
+  if (FALSE_ENV_VALUES.has(normalized)) {
     return { ok: true, value: false };
   }
   return {
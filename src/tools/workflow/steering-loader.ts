@@ -4,7 +4,7 @@
  */
 
 import { access, readFile } from 'fs/promises';
-import { join } from 'path';
+import { join, sep } from 'path';
 import {
   areFileFingerprintsEqual,
   type FileContentFingerprint,
@@ -41,9 +41,10 @@ export async function getSteeringDocs(
   cache?: IFileContentCache
 ): Promise<SteeringDocsResult | null> {
   const result: SteeringDocsResult = {};
+  const steeringDir = buildSteeringDir(projectPath);
 
   for (const doc of docs) {
-    const docPath = buildSteeringDocPath(projectPath, doc);
+    const docPath = steeringDocPathIn(steeringDir, doc);
     try {
       if (cache) {
         const cached = await cache.get(docPath, { namespace: 'steering' });
@@ -63,8 +64,16 @@ export async function getSteeringDocs(
   return Object.keys(result).length > 0 ? result : null;
 }
 
+function buildSteeringDir(projectPath: string): string {
+  return join(projectPath, '.spec-context', 'steering');
+}
+
+function steeringDocPathIn(steeringDir: string, doc: SteeringDocType): string {
+  return `${steeringDir}${sep}${doc}.md`;
+}
+
 export function buildSteeringDocPath(projectPath: string, doc: SteeringDocType): string {
-  return join(projectPath, '.spec-context', 'steering', `${doc}.md`);
+  return steeringDocPathIn(buildSteeringDir(projectPath), doc);
 }
 
 export function collectSteeringFingerprints(
@@ -73,8 +82,9 @@ export function collectSteeringFingerprints(
   fileContentCache: IFileContentCache
 ): SteeringFingerprintMap {
   const fingerprints: SteeringFingerprintMap = {};
+  const steeringDir = buildSteeringDir(projectPath);
   for (const doc of docs) {
-    const fingerprint = fileContentCache.getFingerprint(buildSteeringDocPath(projectPath, doc));
+    const fingerprint = fileContentCache.getFingerprint(steeringDocPathIn(steeringDir, doc));
     if (fingerprint) {
       fingerprints[doc] = fingerprint;
     }
@@ -90,8 +100,9 @@ export function hasSteeringFingerprintMismatch(
     fileContentCache: IFileContentCache;
   }
 ): boolean {
+  const steeringDir = buildSteeringDir(args.projectPath);
   for (const doc of args.docs) {
-    const current = args.fileContentCache.getFingerprint(buildSteeringDocPath(args.projectPath, doc));
+    const current = args.fileContentCache.getFingerprint(steeringDocPathIn(steeringDir, doc));
     const previous = args.previous[doc];
     if (!current || !previous) {
       return true;
@@ -111,11 +122,11 @@ export async function getMissingSteeringDocs(
   projectPath: string,
   required: SteeringDocType[]
 ): Promise<SteeringDocType[]> {
-  const steeringDir = join(projectPath, '.spec-context', 'steering');
+  const steeringDir = buildSteeringDir(projectPath);
   const missing: SteeringDocType[] = [];
 
   for (const doc of required) {
-    const docPath = join(steeringDir, `${doc}.md`);
+    const docPath = steeringDocPathIn(steeringDir, doc);
     try {
       await access(docPath);
     } catch (error) {
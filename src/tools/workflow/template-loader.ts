@@ -36,8 +36,16 @@ export type SteeringTemplateResult = Partial<Record<SteeringTemplateType, Steeri
 export type TemplateFingerprintMap = Partial<Record<SpecTemplateType, FileContentFingerprint>>;
 export type SteeringTemplateFingerprintMap = Partial<Record<SteeringTemplateType, FileContentFingerprint>>;
 
+const BUNDLED_TEMPLATES_DIR = join(__dirname, '..', '..', 'templates');
+const BUNDLED_TEMPLATE_PATHS = Object.fromEntries(
+  [...SPEC_WORKFLOW_TEMPLATES, ...STEERING_WORKFLOW_TEMPLATES].map(template => [
+    template,
+    join(BUNDLED_TEMPLATES_DIR, `${template}-template.md`),
+  ])
+) as Record<WorkflowTemplateType, string>;
+
 export function buildBundledTemplatePath(template: WorkflowTemplateType): string {
-  return join(__dirname, '..', '..', 'templates', `${template}-template.md`);
+  return BUNDLED_TEMPLATE_PATHS[template];
 }
 
 export async function getSpecTemplates(